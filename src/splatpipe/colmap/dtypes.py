@@ -0,0 +1,16 @@
+"""numpy record layouts shared by the text and binary COLMAP parsers."""
+
+import numpy as np
+
+# One POINTS2D observation of an image (x, y, POINT3D_ID; -1 = unmatched),
+# laid out exactly as in images.bin
+POINTS2D_DTYPE = np.dtype([("x", "<f8"), ("y", "<f8"), ("point3d_id", "<i8")])
+
+# Fixed-width prefix of a points3D.txt row (everything before the TRACK list).
+# RGB is wider than uint8 so out-of-range colors parse as they always did.
+POINTS3D_DTYPE = np.dtype([
+    ("point3d_id", "<i8"),
+    ("x", "<f8"), ("y", "<f8"), ("z", "<f8"),
+    ("r", "<i4"), ("g", "<i4"), ("b", "<i4"),
+    ("error", "<f8"),
+])
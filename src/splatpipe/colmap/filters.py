@@ -9,8 +9,11 @@ import statistics
 import time
 from pathlib import Path
 
+import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 from scipy.spatial import cKDTree
 
+from .parsers import parse_points3d_txt_batches, stream_comment_lines
 from .ply_io import read_binary_ply, ply_vertices_to_colmap_coords
 
 
@@ -168,42 +171,37 @@ def filter_points3d_kdtree(
             "max": float(colmap_coords[:, i].max()),
         }
 
-    # Stream points3D, query each
+    # Stream points3D in batches, query each batch against the tree at once
     kept = 0
     total = 0
     kept_ids = set()
-    coord_ranges_before = {"x": [float("inf"), float("-inf")],
-                           "y": [float("inf"), float("-inf")],
-                           "z": [float("inf"), float("-inf")]}
-    coord_ranges_after = {"x": [float("inf"), float("-inf")],
-                          "y": [float("inf"), float("-inf")],
-                          "z": [float("inf"), float("-inf")]}
-
-    with open(points3d_in, "r") as fin, open(points3d_out, "w") as fout:
-        for line in fin:
-            if line.startswith("#"):
-                fout.write(line)
+    before_min, before_max = np.full(3, np.inf), np.full(3, -np.inf)
+    after_min, after_max = np.full(3, np.inf), np.full(3, -np.inf)
+
+    with open(points3d_out, "w") as fout:
+        fout.writelines(stream_comment_lines(points3d_in))
+        for lines, points in parse_points3d_txt_batches(points3d_in):
+            xyz = structured_to_unstructured(points[["x", "y", "z"]])
+            total += len(points)
+            np.minimum(before_min, xyz.min(axis=0), out=before_min)
+            np.maximum(before_max, xyz.max(axis=0), out=before_max)
+
+            dist, _ = tree.query(xyz, distance_upper_bound=threshold)
+            keep = dist <= threshold
+            if not keep.any():
                 continue
-            parts = line.split(maxsplit=4)
-            if len(parts) < 4:
-                continue
-            total += 1
-            pid = int(parts[0])
-            x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-
-            # Track before ranges
-            for axis, val in zip(("x", "y", "z"), (x, y, z)):
-                coord_ranges_before[axis][0] = min(coord_ranges_before[axis][0], val)
-                coord_ranges_before[axis][1] = max(coord_ranges_before[axis][1], val)
-
-            dist, _ = tree.query([x, y, z], distance_upper_bound=threshold)
-            if dist <= threshold:
-                fout.write(line)
-                kept += 1
-                kept_ids.add(pid)
-                for axis, val in zip(("x", "y", "z"), (x, y, z)):
-                    coord_ranges_after[axis][0] = min(coord_ranges_after[axis][0], val)
-                    coord_ranges_after[axis][1] = max(coord_ranges_after[axis][1], val)
+            fout.writelines(line for line, k in zip(lines, keep.tolist()) if k)
+            kept += int(keep.sum())
+            kept_ids.update(points["point3d_id"][keep].tolist())
+            np.minimum(after_min, xyz[keep].min(axis=0), out=after_min)
+            np.maximum(after_max, xyz[keep].max(axis=0), out=after_max)
+
+    coord_ranges_before = {
+        axis: [float(before_min[i]), float(before_max[i])] for i, axis in enumerate(("x", "y", "z"))
+    }
+    coord_ranges_after = {
+        axis: [float(after_min[i]), float(after_max[i])] for i, axis in enumerate(("x", "y", "z"))
+    }
 
     duration = time.time() - t0
 
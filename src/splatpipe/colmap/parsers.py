@@ -4,9 +4,22 @@ These parsers are generators that yield one record at a time,
 keeping memory usage constant regardless of file size.
 """
 
+import mmap
+import os
+import re
+from itertools import islice
 from pathlib import Path
 from typing import Generator
 
+import numpy as np
+
+from .dtypes import POINTS3D_DTYPE
+
+# A line start (after "\n") whose line is a comment or whitespace-only
+_SKIP_LINE_AFTER_NL_RE = re.compile(rb"\n(?=#|[ \t\r\f\v]*(?:\n|\Z))")
+_SKIP_FIRST_LINE_RE = re.compile(rb"#|[ \t\r\f\v]*(?:\n|\Z)")
+_COUNT_WINDOW = 16 << 20
+
 
 def parse_cameras_txt(path: str | Path) -> Generator[dict, None, None]:
     """Parse cameras.txt, yield one camera dict per line.
@@ -55,12 +68,11 @@ def parse_images_txt(path: str | Path) -> Generator[dict, None, None]:
             if pts_line_stripped:
                 pts_parts = pts_line_stripped.split()
                 if len(pts_parts) >= 3 and len(pts_parts) % 3 == 0:
-                    for i in range(0, len(pts_parts), 3):
-                        points2d.append({
-                            "x": float(pts_parts[i]),
-                            "y": float(pts_parts[i + 1]),
-                            "point3d_id": int(pts_parts[i + 2]),
-                        })
+                    it = iter(pts_parts)
+                    points2d = [
+                        {"x": float(x), "y": float(y), "point3d_id": int(pid)}
+                        for x, y, pid in zip(it, it, it)
+                    ]
 
             yield {
                 "image_id": int(parts[0]),
@@ -82,6 +94,9 @@ def parse_images_txt(path: str | Path) -> Generator[dict, None, None]:
 def parse_points3d_txt(path: str | Path) -> Generator[dict, None, None]:
     """Parse points3D.txt, yield one point dict per line.
 
+    The fixed columns are bulk-parsed per batch by
+    :func:`parse_points3d_txt_batches`; the TRACK tail is split per line.
+
     Yields:
         {
             "point3d_id": int, "x": float, "y": float, "z": float,
@@ -90,55 +105,84 @@ def parse_points3d_txt(path: str | Path) -> Generator[dict, None, None]:
             "line": str
         }
     """
+    names = POINTS3D_DTYPE.names
+    for lines, points in parse_points3d_txt_batches(path):
+        for values, line in zip(points.tolist(), lines):
+            point = dict(zip(names, values))
+            ids = map(int, line.split()[8:])
+            point["track"] = [
+                {"image_id": image_id, "point2d_idx": idx} for image_id, idx in zip(ids, ids)
+            ]
+            point["line"] = line
+            yield point
+
+
+def parse_points3d_txt_batches(
+    path: str | Path, batch_size: int = 65536,
+) -> Generator[tuple[list[str], np.ndarray], None, None]:
+    """Parse points3D.txt in bounded batches, bulk-decoding the fixed columns.
+
+    Reads ``batch_size`` lines at a time and parses the first 8 columns of
+    every data line in C (``np.loadtxt``); the TRACK tail is left in the raw
+    line. Memory stays bounded by the batch, not the file.
+
+    Yields:
+        (lines, points): the raw data lines (comments, blanks and rows with
+        fewer than 8 columns skipped) and a POINTS3D_DTYPE structured array
+        aligned with them.
+    """
     with open(path, "r") as f:
-        for line in f:
-            if line.startswith("#") or not line.strip():
-                continue
-            parts = line.split()
-            if len(parts) < 8:
-                continue
+        while batch := list(islice(f, batch_size)):
+            lines = [
+                line for line in batch
+                if not line.startswith("#") and len(line.split(None, 8)) >= 8
+            ]
+            if lines:
+                yield lines, np.loadtxt(lines, dtype=POINTS3D_DTYPE, usecols=range(8), ndmin=1)
 
-            track = []
-            for i in range(8, len(parts), 2):
-                if i + 1 < len(parts):
-                    track.append({
-                        "image_id": int(parts[i]),
-                        "point2d_idx": int(parts[i + 1]),
-                    })
 
-            yield {
-                "point3d_id": int(parts[0]),
-                "x": float(parts[1]),
-                "y": float(parts[2]),
-                "z": float(parts[3]),
-                "r": int(parts[4]),
-                "g": int(parts[5]),
-                "b": int(parts[6]),
-                "error": float(parts[7]),
-                "track": track,
-                "line": line,
-            }
+def _count_data_lines(path: str | Path) -> int:
+    """Count non-comment, non-blank lines with C-level scans over an mmap.
+
+    Newlines are counted with ``bytes.count`` over bounded windows and the
+    comment/blank lines are subtracted via one regex pass, so no per-line
+    Python work happens and memory stays bounded.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            newlines = sum(
+                mm[i:i + _COUNT_WINDOW].count(b"\n") for i in range(0, size, _COUNT_WINDOW)
+            )
+            ends_with_nl = mm[size - 1] == ord("\n")
+            lines = newlines + (0 if ends_with_nl else 1)
+            skipped = sum(1 for _ in _SKIP_LINE_AFTER_NL_RE.finditer(mm))
+            if ends_with_nl:
+                skipped -= 1  # the empty "line" after the final newline
+            if _SKIP_FIRST_LINE_RE.match(mm):
+                skipped += 1
+    return lines - skipped
 
 
 def count_cameras(path: str | Path) -> int:
     """Count cameras in cameras.txt without loading all data."""
-    count = 0
-    with open(path, "r") as f:
-        for line in f:
-            if not line.startswith("#") and line.strip():
-                count += 1
-    return count
+    return _count_data_lines(path)
 
 
 def count_images(path: str | Path) -> int:
-    """Count images in images.txt without loading all data."""
+    """Count images in images.txt without loading all data.
+
+    Pose lines are paired with a POINTS2D line (possibly empty), so this
+    walks lines; the long POINTS2D lines are skipped as raw bytes, undecoded.
+    """
     count = 0
-    with open(path, "r") as f:
+    with open(path, "rb") as f:
         for line in f:
-            if line.startswith("#") or not line.strip():
+            if line.startswith(b"#") or not line.strip():
                 continue
-            parts = line.split()
-            if len(parts) >= 10:
+            if len(line.split(maxsplit=10)) >= 10:
                 count += 1
                 next(f, None)  # skip POINTS2D line
     return count
@@ -146,12 +190,7 @@ def count_images(path: str | Path) -> int:
 
 def count_points3d(path: str | Path) -> int:
     """Count points in points3D.txt without loading all data."""
-    count = 0
-    with open(path, "r") as f:
-        for line in f:
-            if not line.startswith("#") and line.strip():
-                count += 1
-    return count
+    return _count_data_lines(path)
 
 
 def stream_comment_lines(path: str | Path) -> list[str]:
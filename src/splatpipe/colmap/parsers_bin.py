@@ -2,15 +2,21 @@
 
 Binary format is the default COLMAP export from RealityCapture and other tools.
 These parsers are streaming generators matching the same dict format as the
-text parsers in parsers.py.  Uses `struct` only (no external deps).
+text parsers in parsers.py.  Files are memory-mapped and decoded in place
+with `struct.Struct.unpack_from`, plus numpy for POINTS2D blocks.
 
 Reference: https://colmap.github.io/format.html#binary-file-format
 """
 
+import mmap
 import struct
 from pathlib import Path
 from typing import Generator
 
+import numpy as np
+
+from .dtypes import POINTS2D_DTYPE
+
 # Camera model ID → (name, num_params)
 CAMERA_MODELS = {
     0: ("SIMPLE_PINHOLE", 3),
@@ -26,6 +32,17 @@ CAMERA_MODELS = {
     10: ("THIN_PRISM_FISHEYE", 12),
 }
 
+# Fixed-size record prefixes, unpacked in place from the mapped file
+_U64 = struct.Struct("<Q")
+_CAMERA_HEADER = struct.Struct("<IiQQ")  # camera_id, model_id, width, height
+_IMAGE_HEADER = struct.Struct("<I4d3dI")  # image_id, qvec, tvec, camera_id
+_POINT3D_HEADER = struct.Struct("<Q3d3BdQ")  # id, xyz, rgb, error, track_length
+
+
+def _map_readonly(f) -> mmap.mmap:
+    """Map an open binary file read-only (records are decoded straight from the map)."""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
 
 def parse_cameras_bin(path: str | Path) -> Generator[dict, None, None]:
     """Parse cameras.bin, yield one camera dict per entry.
@@ -33,15 +50,15 @@ def parse_cameras_bin(path: str | Path) -> Generator[dict, None, None]:
     Yields same keys as parse_cameras_txt:
         {"camera_id": int, "model": str, "width": int, "height": int, "params": list[float]}
     """
-    with open(path, "rb") as f:
-        num_cameras = struct.unpack("<Q", f.read(8))[0]
+    with open(path, "rb") as f, _map_readonly(f) as mm:
+        (num_cameras,) = _U64.unpack_from(mm, 0)
+        offset = _U64.size
         for _ in range(num_cameras):
-            camera_id = struct.unpack("<I", f.read(4))[0]
-            model_id = struct.unpack("<i", f.read(4))[0]
-            width = struct.unpack("<Q", f.read(8))[0]
-            height = struct.unpack("<Q", f.read(8))[0]
+            camera_id, model_id, width, height = _CAMERA_HEADER.unpack_from(mm, offset)
+            offset += _CAMERA_HEADER.size
             model_name, num_params = CAMERA_MODELS.get(model_id, (f"UNKNOWN_{model_id}", 0))
-            params = list(struct.unpack(f"<{num_params}d", f.read(num_params * 8)))
+            params = list(struct.unpack_from(f"<{num_params}d", mm, offset))
+            offset += num_params * 8
             yield {
                 "camera_id": camera_id,
                 "model": model_name,
@@ -59,28 +76,29 @@ def parse_images_bin(path: str | Path) -> Generator[dict, None, None]:
         {"image_id", "qw", "qx", "qy", "qz", "tx", "ty", "tz",
          "camera_id", "name", "points2d": [{"x", "y", "point3d_id"}]}
     """
-    with open(path, "rb") as f:
-        num_images = struct.unpack("<Q", f.read(8))[0]
+    with open(path, "rb") as f, _map_readonly(f) as mm:
+        (num_images,) = _U64.unpack_from(mm, 0)
+        offset = _U64.size
         for _ in range(num_images):
-            image_id = struct.unpack("<I", f.read(4))[0]
-            qw, qx, qy, qz = struct.unpack("<4d", f.read(32))
-            tx, ty, tz = struct.unpack("<3d", f.read(24))
-            camera_id = struct.unpack("<I", f.read(4))[0]
-            # Read null-terminated name
-            name_bytes = b""
-            while True:
-                c = f.read(1)
-                if c == b"\x00" or not c:
-                    break
-                name_bytes += c
-            name = name_bytes.decode("utf-8")
-            # Read POINTS2D
-            num_points2d = struct.unpack("<Q", f.read(8))[0]
-            points2d = []
-            for _ in range(num_points2d):
-                x, y = struct.unpack("<2d", f.read(16))
-                point3d_id = struct.unpack("<q", f.read(8))[0]  # signed int64
-                points2d.append({"x": x, "y": y, "point3d_id": point3d_id})
+            image_id, qw, qx, qy, qz, tx, ty, tz, camera_id = _IMAGE_HEADER.unpack_from(mm, offset)
+            offset += _IMAGE_HEADER.size
+            # Null-terminated name (unterminated at EOF: take the rest)
+            name_end = mm.find(b"\x00", offset)
+            if name_end == -1:
+                name_end = len(mm)
+            name = mm[offset:name_end].decode("utf-8")
+            offset = name_end + 1
+            (num_points2d,) = _U64.unpack_from(mm, offset)
+            offset += _U64.size
+            # (x: f64, y: f64, point3d_id: signed i64) records decoded as one
+            # block; tolist() yields plain Python floats/ints, no map views
+            points2d = [
+                {"x": x, "y": y, "point3d_id": point3d_id}
+                for x, y, point3d_id in np.frombuffer(
+                    mm, dtype=POINTS2D_DTYPE, count=num_points2d, offset=offset,
+                ).tolist()
+            ]
+            offset += num_points2d * POINTS2D_DTYPE.itemsize
             yield {
                 "image_id": image_id,
                 "qw": qw, "qx": qx, "qy": qy, "qz": qz,
@@ -98,19 +116,21 @@ def parse_points3d_bin(path: str | Path) -> Generator[dict, None, None]:
         {"point3d_id", "x", "y", "z", "r", "g", "b", "error",
          "track": [{"image_id", "point2d_idx"}]}
     """
-    with open(path, "rb") as f:
-        num_points = struct.unpack("<Q", f.read(8))[0]
+    with open(path, "rb") as f, _map_readonly(f) as mm:
+        (num_points,) = _U64.unpack_from(mm, 0)
+        offset = _U64.size
         for _ in range(num_points):
-            point3d_id = struct.unpack("<Q", f.read(8))[0]
-            x, y, z = struct.unpack("<3d", f.read(24))
-            r, g, b = struct.unpack("<3B", f.read(3))
-            error = struct.unpack("<d", f.read(8))[0]
-            track_length = struct.unpack("<Q", f.read(8))[0]
-            track = []
-            for _ in range(track_length):
-                image_id = struct.unpack("<I", f.read(4))[0]
-                point2d_idx = struct.unpack("<I", f.read(4))[0]
-                track.append({"image_id": image_id, "point2d_idx": point2d_idx})
+            point3d_id, x, y, z, r, g, b, error, track_length = _POINT3D_HEADER.unpack_from(
+                mm, offset,
+            )
+            offset += _POINT3D_HEADER.size
+            # TRACK[] as flat (image_id, point2d_idx) u32 pairs
+            flat = struct.unpack_from(f"<{2 * track_length}I", mm, offset)
+            offset += 8 * track_length
+            track = [
+                {"image_id": image_id, "point2d_idx": point2d_idx}
+                for image_id, point2d_idx in zip(flat[::2], flat[1::2])
+            ]
             yield {
                 "point3d_id": point3d_id,
                 "x": x, "y": y, "z": z,
@@ -3,6 +3,21 @@
 from pathlib import Path
 
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
+
+try:
+    import pyminiply  # optional native reader: pip install -e ".[ply]"
+except ImportError:
+    pyminiply = None
+
+# Vertex layouts pyminiply decodes losslessly (xyz [+ normals] [+ rgb]).
+# Anything else (opacity, SH, scale, ...) goes through the numpy reader.
+_XYZ = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
+_NORMALS = [("nx", "<f4"), ("ny", "<f4"), ("nz", "<f4")]
+_RGB = [("red", "u1"), ("green", "u1"), ("blue", "u1")]
+_MINIPLY_DTYPES = tuple(
+    np.dtype(fields) for fields in (_XYZ, _XYZ + _NORMALS, _XYZ + _RGB, _XYZ + _NORMALS + _RGB)
+)
 
 
 def read_ply_header(f) -> tuple[int, list[str]]:
@@ -22,55 +37,98 @@ def read_ply_header(f) -> tuple[int, list[str]]:
     return num_vertices, header_lines
 
 
+def _vertex_dtype(header_lines: list[str]) -> np.dtype:
+    """Build the numpy dtype of the vertex element from PLY header lines."""
+    # Determine vertex format from header properties
+    props = []
+    in_vertex = False
+    for line in header_lines:
+        if line.startswith("element vertex"):
+            in_vertex = True
+            continue
+        if line.startswith("element ") and in_vertex:
+            in_vertex = False
+            continue
+        if in_vertex and line.startswith("property"):
+            props.append(line)
+
+    # Build numpy dtype from properties
+    dtype_map = {
+        "float": "<f4", "float32": "<f4",
+        "double": "<f8", "float64": "<f8",
+        "uchar": "u1", "uint8": "u1",
+        "char": "i1", "int8": "i1",
+        "ushort": "<u2", "uint16": "<u2",
+        "short": "<i2", "int16": "<i2",
+        "uint": "<u4", "uint32": "<u4",
+        "int": "<i4", "int32": "<i4",
+    }
+
+    dt_fields = []
+    for prop in props:
+        parts = prop.split()
+        # "property <type> <name>"
+        ptype = parts[1]
+        pname = parts[2]
+        if ptype not in dtype_map:
+            raise ValueError(f"Unknown PLY property type: {ptype}")
+        dt_fields.append((pname, dtype_map[ptype]))
+
+    return np.dtype(dt_fields)
+
+
+def _check_vertex_count(ply_path: Path, expected: int, actual: int) -> None:
+    """Raise if the decoded vertex count doesn't match the header's count."""
+    if actual != expected:
+        raise ValueError(
+            f"Truncated PLY {ply_path}: header declares {expected} "
+            f"vertices, file holds {actual}"
+        )
+
+
+def _read_miniply(ply_path: Path, dt: np.dtype, num_vertices: int) -> np.ndarray:
+    """Decode a standard-layout PLY natively via pyminiply into dtype ``dt``."""
+    has_normals = "nx" in dt.names
+    has_color = "red" in dt.names
+    xyz, _, normals, _, color = pyminiply.read(
+        ply_path, read_normals=has_normals, read_uv=False, read_color=has_color,
+    )
+    # pyminiply returns None for the positions when the vertex block is short
+    _check_vertex_count(ply_path, num_vertices, 0 if xyz is None else len(xyz))
+    vertices = np.empty(len(xyz), dtype=dt)
+    vertices["x"], vertices["y"], vertices["z"] = xyz.T
+    if has_normals:
+        vertices["nx"], vertices["ny"], vertices["nz"] = normals.T
+    if has_color:
+        # Stored as-is: a float or rescaled color array would silently change values
+        if color.dtype != dt["red"]:
+            raise ValueError(
+                f"pyminiply returned {color.dtype} colors for {ply_path}, "
+                f"expected {dt['red']}"
+            )
+        vertices["red"], vertices["green"], vertices["blue"] = color.T
+    return vertices
+
+
 def read_binary_ply(ply_path: str | Path) -> np.ndarray:
     """Read a binary little-endian PLY with float x,y,z and uchar r,g,b.
 
+    Uses the native pyminiply decoder when installed and the vertex layout is
+    plain xyz/normals/rgb; any other layout is read with numpy.
+
     Returns structured numpy array with fields: x, y, z, r, g, b
     """
     ply_path = Path(ply_path)
     with open(ply_path, "rb") as f:
         num_vertices, header_lines = read_ply_header(f)
+        dt = _vertex_dtype(header_lines)
+        if pyminiply is None or dt not in _MINIPLY_DTYPES:
+            # One native read straight into the array buffer (no bytes copy)
+            vertices = np.fromfile(f, dtype=dt, count=num_vertices)
+            _check_vertex_count(ply_path, num_vertices, len(vertices))
+            return vertices
 
-        # Determine vertex format from header properties
-        props = []
-        in_vertex = False
-        for line in header_lines:
-            if line.startswith("element vertex"):
-                in_vertex = True
-                continue
-            if line.startswith("element ") and in_vertex:
-                in_vertex = False
-                continue
-            if in_vertex and line.startswith("property"):
-                props.append(line)
-
-        # Build numpy dtype from properties
-        dtype_map = {
-            "float": "<f4", "float32": "<f4",
-            "double": "<f8", "float64": "<f8",
-            "uchar": "u1", "uint8": "u1",
-            "char": "i1", "int8": "i1",
-            "ushort": "<u2", "uint16": "<u2",
-            "short": "<i2", "int16": "<i2",
-            "uint": "<u4", "uint32": "<u4",
-            "int": "<i4", "int32": "<i4",
-        }
-
-        dt_fields = []
-        for prop in props:
-            parts = prop.split()
-            # "property <type> <name>"
-            ptype = parts[1]
-            pname = parts[2]
-            if ptype not in dtype_map:
-                raise ValueError(f"Unknown PLY property type: {ptype}")
-            dt_fields.append((pname, dtype_map[ptype]))
-
-        dt = np.dtype(dt_fields)
-        data = f.read(num_vertices * dt.itemsize)
-
-    vertices = np.frombuffer(data, dtype=dt, count=num_vertices)
-    return vertices
+    return _read_miniply(ply_path, dt, num_vertices)
 
 
 def ply_vertices_to_colmap_coords(vertices: np.ndarray,
@@ -85,12 +143,17 @@ def ply_vertices_to_colmap_coords(vertices: np.ndarray,
 
     Returns Nx3 float64 array in COLMAP coordinate space.
     """
-    px = vertices["x"].astype(np.float64)
-    py = vertices["y"].astype(np.float64)
-    pz = vertices["z"].astype(np.float64)
-
     mat = np.array(transform, dtype=np.float64).reshape(3, 3)
-    ply_coords = np.column_stack([px, py, pz])
-    colmap_coords = ply_coords @ mat.T
 
-    return colmap_coords
+    # Signed axis permutation (the default and every Z-up/Y-up swap): each
+    # output column is one fused read-convert-sign pass over the source field,
+    # with no intermediate (N,3) copy and no 3x3 matmul.
+    unit = np.abs(mat)
+    if np.isin(mat, (-1.0, 0.0, 1.0)).all() and (unit.sum(axis=0) == 1).all() and (unit.sum(axis=1) == 1).all():
+        colmap_coords = np.empty((len(vertices), 3), dtype=np.float64)
+        for i, src in enumerate(unit.argmax(axis=1)):
+            np.multiply(vertices["xyz"[src]], mat[i, src], out=colmap_coords[:, i])
+        return colmap_coords
+
+    ply_coords = structured_to_unstructured(vertices[["x", "y", "z"]], dtype=np.float64)
+    return ply_coords @ mat.T
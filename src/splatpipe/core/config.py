@@ -1,5 +1,6 @@
 """TOML config loader: defaults + per-project merge."""
 
+import copy
 import shutil
 import subprocess
 import tomllib
@@ -22,16 +23,41 @@ TOOL_SEARCH_PATHS: dict[str, list[str]] = {
 }
 
 
+# Parsed defaults.toml per path: (mtime_ns, size, parsed dict)
+_DEFAULTS_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
 def load_defaults() -> dict:
-    """Load the global defaults.toml."""
-    with open(DEFAULTS_PATH, "rb") as f:
-        return tomllib.load(f)
+    """Load the global defaults.toml.
+
+    Parsed once and re-parsed only when the file's mtime/size change; every
+    call returns a fresh deep copy, so callers may mutate the result.
+    """
+    st = DEFAULTS_PATH.stat()
+    cached = _DEFAULTS_CACHE.get(DEFAULTS_PATH)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        with open(DEFAULTS_PATH, "rb") as f:
+            cached = (st.st_mtime_ns, st.st_size, tomllib.load(f))
+        _DEFAULTS_CACHE[DEFAULTS_PATH] = cached
+    return copy.deepcopy(cached[2])
+
+
+def _write_toml(path: Path, config: dict) -> bool:
+    """Serialize config and write it in one call; skip if the file is unchanged.
+
+    Returns True if the file was written.
+    """
+    data = tomli_w.dumps(config).encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
 
 
 def save_defaults(config: dict) -> None:
     """Write the global defaults.toml."""
-    with open(DEFAULTS_PATH, "wb") as f:
-        tomli_w.dump(config, f)
+    if _write_toml(DEFAULTS_PATH, config):
+        _DEFAULTS_CACHE.pop(DEFAULTS_PATH, None)
 
 
 def load_project_config(project_toml: Path) -> dict:
@@ -46,8 +72,7 @@ def load_project_config(project_toml: Path) -> dict:
 
 def save_project_config(project_toml: Path, config: dict) -> None:
     """Write a project.toml file."""
-    with open(project_toml, "wb") as f:
-        tomli_w.dump(config, f)
+    _write_toml(project_toml, config)
 
 
 def get_tool_path(config: dict, tool_name: str) -> Path:
@@ -132,24 +157,35 @@ def auto_detect_tools() -> dict[str, str | None]:
     return found
 
 
+_DEPENDENCY_PACKAGES = ("numpy", "scipy", "fastapi", "uvicorn", "jinja2",
+                        "sse_starlette", "typer", "rich", "tomli_w")
+# Probed once per process; installs don't change under a running server
+_DEPS_CACHE: dict[str, bool] | None = None
+
+
 def check_dependencies() -> dict[str, bool]:
-    """Check which Python packages are available."""
-    packages = ["numpy", "scipy", "fastapi", "uvicorn", "jinja2",
-                "sse_starlette", "typer", "rich", "tomli_w"]
-    result = {}
-    for pkg in packages:
-        try:
-            __import__(pkg)
-            result[pkg] = True
-        except ImportError:
-            result[pkg] = False
-    return result
+    """Check which Python packages are available (cached; returns a copy)."""
+    global _DEPS_CACHE
+    if _DEPS_CACHE is None:
+        result = {}
+        for pkg in _DEPENDENCY_PACKAGES:
+            try:
+                __import__(pkg)
+                result[pkg] = True
+            except ImportError:
+                result[pkg] = False
+        _DEPS_CACHE = result
+    return dict(_DEPS_CACHE)
 
 
 def _deep_merge(base: dict, override: dict) -> None:
-    """Merge override into base in-place, recursing into dicts."""
-    for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = value
+    """Merge override into base in-place, descending into nested dicts."""
+    stack = [(base, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
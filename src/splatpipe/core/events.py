@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Generator
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressEvent:
     """A progress update yielded by long-running operations.
 
@@ -18,7 +18,7 @@ class ProgressEvent:
     sub_progress: float = 0.0  # 0.0 to 1.0 within sub_step
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of a completed step."""
     step: str
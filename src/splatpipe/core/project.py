@@ -438,6 +438,33 @@ class Project:
         Updates the per-step latest status AND appends terminal statuses
         (completed, failed, cancelled) to the history log.
         """
+        self._apply_step_record(
+            step_name, status, summary=summary, error=error, started_at=started_at,
+        )
+        self._save_state()
+
+    def record_step_batch(self, updates: list[tuple[str, str, dict]]) -> None:
+        """Record several step transitions with a single state.json write.
+
+        Each update is ``(step_name, status, kwargs)`` where kwargs are the
+        keyword arguments accepted by :meth:`record_step`.
+        """
+        if not updates:
+            return
+        for step_name, status, kwargs in updates:
+            self._apply_step_record(step_name, status, **kwargs)
+        self._save_state()
+
+    def _apply_step_record(
+        self,
+        step_name: str,
+        status: str,
+        *,
+        summary: dict | None = None,
+        error: str | None = None,
+        started_at: str | None = None,
+    ) -> None:
+        """Update in-memory state for one step transition (no write)."""
         if "steps" not in self.state:
             self.state["steps"] = {}
 
@@ -460,8 +487,6 @@ class Project:
                 "error": error,
             })
 
-        self._save_state()
-
     def _append_history(self, entry: dict) -> None:
         """Append an entry to the history log, trimming if over limit."""
         if "history" not in self.state:
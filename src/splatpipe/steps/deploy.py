@@ -7,7 +7,9 @@ Supports two modes:
 
 import hashlib
 import json
+import mmap
 import os
+import re
 import shutil
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -18,11 +20,39 @@ from urllib.error import HTTPError
 
 from ..core.events import ProgressEvent, StepResult
 
+# One KEY=VALUE assignment per .env line; comment (#) and blank lines never match.
+# Key and value are whitespace-trimmed; the value may itself contain "=".
+_ENV_LINE_RE = re.compile(r"^[ \t\r\f\v]*+(?!#)([^=\n]*?)[ \t\r\f\v]*=[ \t\r\f\v]*(.*?)[ \t\r\f\v]*$", re.MULTILINE)
+
+
+def _scan_files(root: Path) -> list[tuple[Path, int]]:
+    """Recursively list regular files under root as sorted (path, size) pairs.
+
+    Uses os.scandir so each entry's type/size comes from one DirEntry (the
+    type is free from the directory listing on most filesystems). Like
+    rglob, symlinked directories are not descended into, and a missing root
+    yields no files.
+    """
+    if not root.is_dir():
+        return []
+    files = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    files.append((Path(entry.path), entry.stat().st_size))
+    files.sort()
+    return files
+
 
 def export_to_folder(
     output_dir: Path,
     destination: Path,
     *,
+    workers: int = 8,
     purge: bool = False,
 ) -> Generator[ProgressEvent, None, StepResult]:
     """Copy output directory to a local destination, yielding progress events.
@@ -30,6 +60,7 @@ def export_to_folder(
     Args:
         output_dir: Directory containing files to export (05_output/)
         destination: Target directory to copy files into
+        workers: Number of parallel copy threads
         purge: If True, delete all existing files in destination before copying
     """
     # Purge destination if requested
@@ -41,8 +72,8 @@ def export_to_folder(
             else:
                 item.unlink()
 
-    # Collect files
-    files = sorted(f for f in output_dir.rglob("*") if f.is_file())
+    # Collect files (stat once; sizes are reused for progress)
+    files = _scan_files(output_dir)
 
     if not files:
         return StepResult(
@@ -50,7 +81,7 @@ def export_to_folder(
             error=f"No files found in {output_dir}",
         )
 
-    total_size = sum(f.stat().st_size for f in files)
+    total_size = sum(size for _, size in files)
     total_count = len(files)
 
     yield ProgressEvent(
@@ -58,27 +89,35 @@ def export_to_folder(
         message=f"Copying {total_count} files ({total_size / 1e6:.1f} MB)",
     )
 
+    # Create the whole directory tree up front so copy threads never race on mkdir
+    targets = [(f, destination / f.relative_to(output_dir), size) for f, size in files]
     destination.mkdir(parents=True, exist_ok=True)
+    for parent in sorted({dest_file.parent for _, dest_file, _ in targets}):
+        parent.mkdir(parents=True, exist_ok=True)
 
     copied = 0
     copied_bytes = 0
     t0 = time.time()
 
-    for f in files:
-        rel = f.relative_to(output_dir)
-        dest_file = destination / rel
-        dest_file.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(f, dest_file)
+    # copy2 -> copyfile uses sendfile/copy_file_range where the OS supports it;
+    # threads overlap the per-file open/fsync/metadata latency.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(shutil.copy2, src, dest_file): size
+            for src, dest_file, size in targets
+        }
 
-        copied += 1
-        copied_bytes += f.stat().st_size
+        for future in as_completed(futures):
+            future.result()
+            copied += 1
+            copied_bytes += futures[future]
 
-        yield ProgressEvent(
-            step="export",
-            progress=copied / total_count,
-            message=f"Copied {copied}/{total_count}",
-            detail=f"{copied_bytes / 1e6:.1f} MB",
-        )
+            yield ProgressEvent(
+                step="export",
+                progress=copied / total_count,
+                message=f"Copied {copied}/{total_count}",
+                detail=f"{copied_bytes / 1e6:.1f} MB",
+            )
 
     duration = time.time() - t0
 
@@ -107,12 +146,7 @@ def load_bunny_env(*env_paths: Path | None) -> dict:
 
     for env_path in env_paths:
         if env_path and env_path.exists():
-            for line in env_path.read_text().splitlines():
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, val = line.split("=", 1)
-                env[key.strip()] = val.strip()
+            env.update(_ENV_LINE_RE.findall(env_path.read_text()))
             break
 
     # Fall back to environment variables
@@ -405,7 +439,22 @@ def upload_file(
     local_path: Path,
 ) -> tuple[str, bool, str]:
     """Upload a single file to Bunny Storage. Returns (remote_path, success, detail)."""
-    data = local_path.read_bytes()
+    with open(local_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _put_bunny_object(storage_zone, password, remote_path, b"")  # can't mmap empty
+        # Map instead of read_bytes(): hashing and the socket send both read the
+        # page cache directly, so a multi-GB PLY never gets a heap copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as body:
+            return _put_bunny_object(storage_zone, password, remote_path, body)
+
+
+def _put_bunny_object(
+    storage_zone: str,
+    password: str,
+    remote_path: str,
+    data: bytes | memoryview,
+) -> tuple[str, bool, str]:
+    """PUT one object body to Bunny Storage. Returns (remote_path, success, detail)."""
     checksum = hashlib.sha256(data).hexdigest()
 
     url = f"https://storage.bunnycdn.com/{storage_zone}/{remote_path}"
@@ -458,13 +507,11 @@ def deploy_to_bunny(
         yield ProgressEvent(step="export", progress=0.0, message="Purging CDN folder...")
         _purge_bunny_folder(storage_zone, password, project_name)
 
-    # Collect files
+    # Collect files (stat once; sizes are reused for progress)
     files = []
-    for f in sorted(output_dir.rglob("*")):
-        if f.is_file():
-            rel = f.relative_to(output_dir).as_posix()
-            remote = f"{project_name}/{rel}"
-            files.append((remote, f))
+    for f, size in _scan_files(output_dir):
+        rel = f.relative_to(output_dir).as_posix()
+        files.append((f"{project_name}/{rel}", f, size))
 
     if not files:
         return StepResult(
@@ -472,7 +519,7 @@ def deploy_to_bunny(
             error=f"No files found in {output_dir}",
         )
 
-    total_size = sum(f.stat().st_size for _, f in files)
+    total_size = sum(size for _, _, size in files)
     total_count = len(files)
 
     yield ProgressEvent(
@@ -488,14 +535,13 @@ def deploy_to_bunny(
 
     with ThreadPoolExecutor(max_workers=workers) as pool:
         futures = {
-            pool.submit(upload_file, storage_zone, password, remote, local): (remote, local)
-            for remote, local in files
+            pool.submit(upload_file, storage_zone, password, remote, local): size
+            for remote, local, size in files
         }
 
         for future in as_completed(futures):
-            remote, local = futures[future]
+            size = futures[future]
             path, success, detail = future.result()
-            size = local.stat().st_size
 
             if success:
                 uploaded += 1
@@ -523,7 +569,7 @@ def deploy_to_bunny(
     purge_failed = 0
     api_key = env.get("BUNNY_ACCOUNT_API_KEY", "")
     if api_key and cdn_url and failed == 0:
-        purge_urls = [f"{cdn_url}/{remote}" for remote, _ in files]
+        purge_urls = [f"{cdn_url}/{remote}" for remote, _, _ in files]
         yield ProgressEvent(
             step="export", progress=1.0,
             message=f"Purging CDN cache for {len(purge_urls)} URLs",
@@ -522,6 +522,7 @@ async def project_detail(request: Request, project_path: str):
     config = load_defaults()
 
     steps_info = []
+    interrupted = []
     for step_name in STEPS:
         step_data = state.get("steps", {}).get(step_name)
         # Compute folder stats for steps with output folders
@@ -538,7 +539,7 @@ async def project_detail(request: Request, project_path: str):
             if r and r.snapshot.status == "running":
                 is_actively_running = True
             else:
-                proj.record_step(step_name, "failed", error="Interrupted (no active runner)")
+                interrupted.append((step_name, "failed", {"error": "Interrupted (no active runner)"}))
                 status = "failed"
         steps_info.append({
             "name": step_name,
@@ -550,6 +551,7 @@ async def project_detail(request: Request, project_path: str):
             "output_folder": str(proj.get_folder(output_folder_name)) if output_folder_name else "",
             "is_actively_running": is_actively_running,
         })
+    proj.record_step_batch(interrupted)
 
     # Collect LOD training folder paths
     training_dir = proj.get_folder(FOLDER_TRAINING)
@@ -7,9 +7,12 @@ All step execution logic lives here. steps.py becomes a thin HTTP/SSE adapter.
 """
 
 import json
+import os
+import re
 import shutil
 import threading
 import time
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -33,6 +36,8 @@ from ..steps.deploy import deploy_to_bunny, export_to_folder, load_bunny_env
 from ..trainers.registry import get_trainer
 
 
+_GLOBAL_ENV_PATH: Path = DEFAULTS_PATH.parent.parent / ".env"
+
 STEP_ORDER = [STEP_CLEAN, STEP_TRAIN, STEP_REVIEW, STEP_ASSEMBLE, STEP_EXPORT]
 STEP_LABELS = {
     STEP_CLEAN: "Clean COLMAP",
@@ -192,6 +197,8 @@ class PipelineRunner:
             self._update(status="cancelled", message="Cancelled.")
 
         except Exception as e:
+            # Executors raise instead of recording their own failure, so the
+            # failed transition is written to state.json exactly once here.
             current = self._snapshot.current_step
             if current:
                 proj.record_step(current, "failed", error=str(e), started_at=self._step_started_at)
@@ -262,11 +269,17 @@ class PipelineRunner:
         self._update(message="Waiting for manual review — approve in the project page")
         while True:
             self._check_cancel()
-            # Re-read state from disk (approval is written by a separate HTTP request)
-            proj._state = None
-            if proj.get_step_status(STEP_REVIEW) == "completed":
+            # Approval is written to disk by a separate HTTP request. Peek at
+            # just the review status; only do a full reload if the peek misses.
+            status = _peek_review_status(proj.state_path)
+            if status is None:
+                proj._state = None
+                status = proj.get_step_status(STEP_REVIEW)
+            if status == "completed":
                 break
             time.sleep(2)
+        # Pick up the approval (and its summary) before later steps write state
+        proj._state = None
         self._update(progress=base_pct + step_range, message="Review approved")
 
     def _execute_train(self, proj: Project, base_pct: float, step_range: float) -> None:
@@ -314,18 +327,17 @@ class PipelineRunner:
         active_lods = [(i, lod) for i, lod in enumerate(all_lod_levels) if lod.get("enabled", True)]
 
         if not active_lods:
-            proj.record_step(STEP_TRAIN, "failed", error="No LOD levels enabled", started_at=self._step_started_at)
             raise Exception("No LOD levels enabled")
 
         # Prepare review directory
         review_dir = proj.get_folder(FOLDER_REVIEW)
         if review_dir.exists():
-            for f in review_dir.iterdir():
-                if f.is_file():
-                    try:
-                        f.unlink()
-                    except OSError:
-                        pass
+            # Files and symlinks (dangling ones too) go; (links to) subfolders stay
+            with os.scandir(review_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        with suppress(OSError):
+                            os.unlink(entry.path)
         review_dir.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -430,7 +442,6 @@ class PipelineRunner:
         summary = result.get("summary", {}) if result else {}
         if not summary.get("success", False):
             stderr = result.get("lod_streaming", {}).get("stderr", "") if result else ""
-            proj.record_step(STEP_ASSEMBLE, "failed", error=f"Assembly failed: {stderr[:500]}", started_at=self._step_started_at)
             raise Exception(f"Assembly failed: {stderr[:500]}")
 
         proj.record_step(STEP_ASSEMBLE, "completed", summary=summary, started_at=self._step_started_at)
@@ -448,11 +459,10 @@ class PipelineRunner:
         if mode == "folder":
             dest = proj.export_folder
             if not dest:
-                proj.record_step(STEP_EXPORT, "failed", error="No export folder configured", started_at=self._step_started_at)
                 raise Exception("No export folder configured")
             gen = export_to_folder(output_dir, Path(dest), purge=purge)
         else:
-            env = load_bunny_env(proj.root / ".env", DEFAULTS_PATH.parent.parent / ".env")
+            env = load_bunny_env(proj.root / ".env", _GLOBAL_ENV_PATH)
             gen = deploy_to_bunny(proj.cdn_name, output_dir, env, purge=purge)
 
         try:
@@ -472,7 +482,6 @@ class PipelineRunner:
             if result.success:
                 proj.record_step(STEP_EXPORT, "completed", summary=result.summary, started_at=self._step_started_at)
             else:
-                proj.record_step(STEP_EXPORT, "failed", error=result.error, started_at=self._step_started_at)
                 raise Exception(result.error)
 
         self._update(
@@ -486,6 +495,14 @@ class PipelineRunner:
 _runners: dict[str, PipelineRunner] = {}
 _runners_lock = threading.Lock()
 
+# Short-lived negative cache for get_runner: stale SSE tabs keep polling
+# projects that have no runner. key -> monotonic expiry time, in insertion
+# order. Only touched under _runners_lock. Expired entries are dropped on
+# lookup; at _NEG_MAX, expired entries and then the oldest are evicted.
+_negative_cache: dict[str, float] = {}
+_NEG_TTL = 5.0
+_NEG_MAX = 256
+
 
 def _normalize_key(project_path: str) -> str:
     """Normalize path to consistent key (resolves Windows backslash/forward-slash mismatch)."""
@@ -501,6 +518,7 @@ def start_run(project_path: str, steps: list[str], config: dict) -> PipelineRunn
             old.cancel()
         runner = PipelineRunner(project_path, steps, config)
         _runners[key] = runner
+        _negative_cache.pop(key, None)
     runner.start()
     return runner
 
@@ -508,8 +526,30 @@ def start_run(project_path: str, steps: list[str], config: dict) -> PipelineRunn
 def get_runner(project_path: str) -> PipelineRunner | None:
     """Get the active runner for a project, or None."""
     key = _normalize_key(project_path)
+    now = time.monotonic()
     with _runners_lock:
-        return _runners.get(key)
+        expiry = _negative_cache.get(key)
+        if expiry is not None:
+            if expiry > now:
+                return None
+            del _negative_cache[key]
+        runner = _runners.get(key)
+        if runner is None:
+            if len(_negative_cache) >= _NEG_MAX:
+                _evict_negative_cache(now)
+            _negative_cache[key] = now + _NEG_TTL
+    return runner
+
+
+def _evict_negative_cache(now: float) -> None:
+    """Drop expired entries, then the oldest, until there is room for one more.
+
+    Caller must hold _runners_lock.
+    """
+    for key in [k for k, expiry in _negative_cache.items() if expiry <= now]:
+        del _negative_cache[key]
+    while len(_negative_cache) >= _NEG_MAX:
+        del _negative_cache[next(iter(_negative_cache))]
 
 
 def cancel_run(project_path: str) -> bool:
@@ -712,6 +752,29 @@ def _clean_lod_dir(lod_dir: Path) -> None:
     lod_dir.mkdir(parents=True, exist_ok=True)
 
 
+# steps.review.status as laid out by Project._save_state (indent=2): "steps"
+# at top level, then only deeper-indented lines until the "review" child of
+# steps, whose first key is "status". "review" keys elsewhere (step_settings,
+# step summaries) sit at other indents and can't match. \r? covers Windows
+# text-mode newlines.
+_REVIEW_STATUS_RE = re.compile(
+    rb'\n  "steps": \{(?:\r?\n    .*)*?\r?\n    "review": \{\r?\n      "status": "([^"]+)"'
+)
+
+
+def _peek_review_status(state_path: Path) -> str | None:
+    """Read steps.review.status from state.json without a full JSON parse.
+
+    Returns None if the file can't be read or the pattern doesn't match;
+    callers should fall back to a full Project reload in that case.
+    """
+    try:
+        m = _REVIEW_STATUS_RE.search(state_path.read_bytes())
+    except OSError:
+        return None
+    return m.group(1).decode() if m else None
+
+
 def _write_train_debug(lod_dir: Path, ret) -> None:
     """Write a training debug JSON for a completed LOD."""
     debug = {
@@ -1,18 +1,66 @@
 """Shared test fixtures."""
 
+import json
 import shutil
 from pathlib import Path
 
 import pytest
 
+from splatpipe.core.project import Project
+
 TEST_DATA = Path(__file__).parent / "test_data"
 
 
+def load_state(project_dir: Path) -> dict:
+    """Parse a project's state.json straight from disk."""
+    return json.loads((project_dir / "state.json").read_bytes())
+
+
 @pytest.fixture
 def test_data_dir():
     return TEST_DATA
 
 
+@pytest.fixture(scope="session")
+def colmap_fixture_dir(tmp_path_factory):
+    """Read-only COLMAP text dataset, built once per session.
+
+    Tests that only *read* COLMAP input (e.g. ``splatpipe init``, which links
+    to the source) share this; anything that writes must use ``tmp_path``.
+    """
+    d = tmp_path_factory.mktemp("colmap_src")
+    shutil.copy(TEST_DATA / "tiny_cameras.txt", d / "cameras.txt")
+    shutil.copy(TEST_DATA / "tiny_images.txt", d / "images.txt")
+    shutil.copy(TEST_DATA / "tiny_points3d.txt", d / "points3D.txt")
+    return d
+
+
+@pytest.fixture(scope="session")
+def readonly_project(tmp_path_factory):
+    """Project with a completed clean step, shared by read-only tests (e.g. status)."""
+    proj = Project.create(tmp_path_factory.mktemp("roproj") / "proj", "StatusTest")
+    proj.record_step("clean", "completed", summary={"cameras_kept": 10})
+    return proj
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory):
+    """Default project named "Test", scaffolded once per session. Do not mutate."""
+    return Project.create(tmp_path_factory.mktemp("tpl") / "proj", "Test")
+
+
+@pytest.fixture
+def fresh_project(tmp_path, project_template):
+    """Per-test copy of ``project_template`` at ``tmp_path / "proj"``."""
+    return Project(shutil.copytree(project_template.root, tmp_path / "proj"))
+
+
+@pytest.fixture(scope="session")
+def empty_output_project(tmp_path_factory):
+    """Freshly created project whose 05_output is empty. Do not mutate."""
+    return Project.create(tmp_path_factory.mktemp("emptyproj") / "proj", "EmptyTest")
+
+
 @pytest.fixture
 def tmp_project(tmp_path):
     """Create a temporary project directory with test COLMAP data."""
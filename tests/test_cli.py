@@ -1,83 +1,68 @@
 """Tests for CLI commands via Typer CliRunner."""
 
-import json
-import shutil
 import struct
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from splatpipe.cli.main import app
 from splatpipe.core.project import Project
+from tests.conftest import load_state
+
+pytestmark = pytest.mark.xdist_group("cli")
 
 TEST_DATA = Path(__file__).parent / "test_data"
+# One runner for the whole module. Typer's CliRunner already captures stderr
+# separately (result.stderr) while result.output keeps the combined stream.
 runner = CliRunner()
 
+# Minimal binary COLMAP model, packed once at import:
+# one SIMPLE_PINHOLE camera, one image with no POINTS2D, no points.
+_CAMERAS_BIN = struct.pack("<QIiQQ3d", 1, 1, 0, 1920, 1080, 1500.0, 960.0, 540.0)
+_IMAGES_BIN = (
+    struct.pack("<QI4d3dI", 1, 1, 0.5, 0.5, 0.5, 0.5, 0.0, 0.0, 0.0, 1)
+    + b"img.jpg\x00"
+    + struct.pack("<Q", 0)
+)
+_POINTS3D_BIN = struct.pack("<Q", 0)
+
 
 def _write_binary_colmap(colmap_dir: Path) -> None:
     """Write minimal binary COLMAP files for testing."""
-    with open(colmap_dir / "cameras.bin", "wb") as f:
-        f.write(struct.pack("<Q", 1))
-        f.write(struct.pack("<I", 1))
-        f.write(struct.pack("<i", 0))  # SIMPLE_PINHOLE
-        f.write(struct.pack("<Q", 1920))
-        f.write(struct.pack("<Q", 1080))
-        f.write(struct.pack("<3d", 1500.0, 960.0, 540.0))
-    with open(colmap_dir / "images.bin", "wb") as f:
-        f.write(struct.pack("<Q", 1))
-        f.write(struct.pack("<I", 1))
-        f.write(struct.pack("<4d", 0.5, 0.5, 0.5, 0.5))
-        f.write(struct.pack("<3d", 0.0, 0.0, 0.0))
-        f.write(struct.pack("<I", 1))
-        f.write(b"img.jpg\x00")
-        f.write(struct.pack("<Q", 0))
-    with open(colmap_dir / "points3D.bin", "wb") as f:
-        f.write(struct.pack("<Q", 0))
+    (colmap_dir / "cameras.bin").write_bytes(_CAMERAS_BIN)
+    (colmap_dir / "images.bin").write_bytes(_IMAGES_BIN)
+    (colmap_dir / "points3D.bin").write_bytes(_POINTS3D_BIN)
 
 
 class TestInitCommand:
-    def test_init_creates_project(self, tmp_path):
+    def test_init_creates_project(self, tmp_path, colmap_fixture_dir):
         """splatpipe init creates project with correct structure."""
-        # Set up a COLMAP directory
-        colmap_dir = tmp_path / "colmap_data"
-        colmap_dir.mkdir()
-        shutil.copy(TEST_DATA / "tiny_cameras.txt", colmap_dir / "cameras.txt")
-        shutil.copy(TEST_DATA / "tiny_images.txt", colmap_dir / "images.txt")
-        shutil.copy(TEST_DATA / "tiny_points3d.txt", colmap_dir / "points3D.txt")
-
         output = tmp_path / "MyProject"
         result = runner.invoke(app, [
-            "init", str(colmap_dir),
+            "init", str(colmap_fixture_dir),
             "--name", "TestProject",
             "--output", str(output),
         ])
 
         assert result.exit_code == 0
-        assert (output / "state.json").exists()
-
-        state = json.loads((output / "state.json").read_text())
+        state = load_state(output)
         assert state["name"] == "TestProject"
         assert state["trainer"] == "postshot"
         assert len(state["lod_levels"]) == 6
 
-    def test_init_custom_lods(self, tmp_path):
+    def test_init_custom_lods(self, tmp_path, colmap_fixture_dir):
         """Custom LODs are parsed correctly."""
-        colmap_dir = tmp_path / "colmap_data"
-        colmap_dir.mkdir()
-        shutil.copy(TEST_DATA / "tiny_cameras.txt", colmap_dir / "cameras.txt")
-        shutil.copy(TEST_DATA / "tiny_images.txt", colmap_dir / "images.txt")
-        shutil.copy(TEST_DATA / "tiny_points3d.txt", colmap_dir / "points3D.txt")
-
         output = tmp_path / "MyProject"
         result = runner.invoke(app, [
-            "init", str(colmap_dir),
+            "init", str(colmap_fixture_dir),
             "--name", "Test",
             "--lods", "3M,1.5M",
             "--output", str(output),
         ])
 
         assert result.exit_code == 0
-        state = json.loads((output / "state.json").read_text())
+        state = load_state(output)
         assert len(state["lod_levels"]) == 2
         assert state["lod_levels"][0]["max_splats"] == 3_000_000
         assert state["lod_levels"][1]["max_splats"] == 1_500_000
@@ -95,7 +80,7 @@ class TestInitCommand:
 
         assert result.exit_code == 0
         assert "Warning" in result.output or "warning" in result.output.lower()
-        assert (tmp_path / "proj" / "state.json").exists()
+        assert load_state(tmp_path / "proj")["name"] == "Test"
 
     def test_init_binary_colmap(self, tmp_path):
         """Binary COLMAP format is detected and reported."""
@@ -112,26 +97,20 @@ class TestInitCommand:
 
         assert result.exit_code == 0
         assert "COLMAP (binary)" in result.output
-        assert (output / "state.json").exists()
+        assert load_state(output)["name"] == "BinaryTest"
 
-    def test_init_custom_trainer(self, tmp_path):
+    def test_init_custom_trainer(self, tmp_path, colmap_fixture_dir):
         """Custom trainer is stored."""
-        colmap_dir = tmp_path / "colmap_data"
-        colmap_dir.mkdir()
-        shutil.copy(TEST_DATA / "tiny_cameras.txt", colmap_dir / "cameras.txt")
-        shutil.copy(TEST_DATA / "tiny_images.txt", colmap_dir / "images.txt")
-        shutil.copy(TEST_DATA / "tiny_points3d.txt", colmap_dir / "points3D.txt")
-
         output = tmp_path / "MyProject"
         result = runner.invoke(app, [
-            "init", str(colmap_dir),
+            "init", str(colmap_fixture_dir),
             "--name", "Test",
             "--trainer", "lichtfeld",
             "--output", str(output),
         ])
 
         assert result.exit_code == 0
-        state = json.loads((output / "state.json").read_text())
+        state = load_state(output)
         assert state["trainer"] == "lichtfeld"
 
     def test_init_psht_file(self, tmp_path):
@@ -148,14 +127,13 @@ class TestInitCommand:
 
         assert result.exit_code == 0, result.output
         assert "Postshot" in result.output
-        state = json.loads((output / "state.json").read_text())
+        state = load_state(output)
         assert state["source_type"] == "postshot"
         # .psht auto-defaults to passthrough trainer
         assert state["trainer"] == "passthrough"
         assert len(state["lod_levels"]) == 1
         # Verify file was copied
         copied = output / "01_colmap_source" / "source.psht"
-        assert copied.exists()
         assert copied.read_bytes() == b"fake psht data"
 
     def test_init_ply_file(self, tmp_path):
@@ -172,12 +150,11 @@ class TestInitCommand:
 
         assert result.exit_code == 0, result.output
         assert "PLY" in result.output
-        state = json.loads((output / "state.json").read_text())
+        state = load_state(output)
         assert state["source_type"] == "ply"
         assert state["trainer"] == "passthrough"
         assert len(state["lod_levels"]) == 1
         copied = output / "01_colmap_source" / "source.ply"
-        assert copied.exists()
         assert copied.read_bytes() == ply_file.read_bytes()
 
     def test_init_explicit_trainer_overrides_auto_passthrough(self, tmp_path):
@@ -194,7 +171,7 @@ class TestInitCommand:
         ])
 
         assert result.exit_code == 0, result.output
-        state = json.loads((output / "state.json").read_text())
+        state = load_state(output)
         assert state["trainer"] == "postshot"
 
 
@@ -220,13 +197,11 @@ class TestExportCommand:
         assert (dest / "lod-meta.json").exists()
         assert (dest / "chunk0.sog").exists()
 
-    def test_export_no_output_files(self, tmp_path):
+    def test_export_no_output_files(self, tmp_path, empty_output_project):
         """Export with empty output dir gives error."""
-        project = Project.create(tmp_path / "proj", "EmptyTest")
-
         result = runner.invoke(app, [
             "export",
-            "--project", str(project.root),
+            "--project", str(empty_output_project.root),
             "--mode", "folder",
             "--destination", str(tmp_path / "dest"),
         ])
@@ -236,12 +211,9 @@ class TestExportCommand:
 
 
 class TestStatusCommand:
-    def test_status_shows_project_info(self, tmp_path):
+    def test_status_shows_project_info(self, readonly_project):
         """Status command displays project details."""
-        project = Project.create(tmp_path / "proj", "StatusTest")
-        project.record_step("clean", "completed", summary={"cameras_kept": 10})
-
-        result = runner.invoke(app, ["status", "--project", str(project.root)])
+        result = runner.invoke(app, ["status", "--project", str(readonly_project.root)])
 
         assert result.exit_code == 0
         assert "StatusTest" in result.output
@@ -1,6 +1,8 @@
 """Tests for COLMAP cleaning filters — the most critical tests."""
 
+import re
 
+import pytest
 
 from splatpipe.colmap.filters import (
     analyze_cameras,
@@ -10,6 +12,13 @@ from splatpipe.colmap.filters import (
     load_kept_point_ids,
 )
 
+pytestmark = pytest.mark.xdist_group("colmap_io")
+
+_KEPT_1_20 = frozenset(range(1, 21))  # the 20 near points
+_KEPT_1_50 = frozenset(range(1, 51))  # every point
+# First image's POINTS2D line: the data line right after the first pose line
+_POINTS2D_LINE_RE = re.compile(rb"(?m)^[^#\s].*\n([^#\s].*)$")
+
 
 class TestAnalyzeCameras:
     def test_basic_analysis(self, tiny_images_path):
@@ -137,9 +146,7 @@ class TestCleanPoints2dRefs:
     def test_clean_dangling_refs(self, tiny_images_path, tmp_path):
         """Replace dangling POINT3D_IDs with -1, keep valid ones."""
         out_path = tmp_path / "images_cleaned.txt"
-        kept_ids = set(range(1, 21))
-
-        result = clean_points2d_refs(tiny_images_path, out_path, kept_ids)
+        result = clean_points2d_refs(tiny_images_path, out_path, _KEPT_1_20)
 
         assert result["cameras"] == 5
         assert result["total_refs"] > 0
@@ -150,20 +157,14 @@ class TestCleanPoints2dRefs:
     def test_clean_preserves_valid_refs(self, tiny_images_path, tmp_path):
         """Valid POINT3D_IDs should be preserved unchanged."""
         out_path = tmp_path / "images_cleaned.txt"
-        kept_ids = set(range(1, 51))  # keep all
-
-        result = clean_points2d_refs(tiny_images_path, out_path, kept_ids)
+        result = clean_points2d_refs(tiny_images_path, out_path, _KEPT_1_50)
         assert result["kept_refs"] > 0
 
     def test_clean_empty_points2d(self, tmp_path):
         """Empty POINTS2D lines pass through unchanged."""
         images_path = tmp_path / "images.txt"
         out_path = tmp_path / "images_out.txt"
-        images_path.write_text(
-            "# test\n"
-            "1 0.5 0.0 0.0 0.0 1.0 2.0 3.0 1 test.jpg\n"
-            "\n"
-        )
+        images_path.write_bytes(b"# test\n1 0.5 0.0 0.0 0.0 1.0 2.0 3.0 1 test.jpg\n\n")
 
         result = clean_points2d_refs(images_path, out_path, set())
         assert result["cameras"] == 1
@@ -173,22 +174,19 @@ class TestCleanPoints2dRefs:
         """Verify specific IDs become -1 in output."""
         images_path = tmp_path / "images.txt"
         out_path = tmp_path / "images_out.txt"
-        images_path.write_text(
-            "# test\n"
-            "1 0.5 0.0 0.0 0.0 1.0 2.0 3.0 1 test.jpg\n"
-            "100.0 200.0 5 300.0 400.0 999 500.0 600.0 -1\n"
+        images_path.write_bytes(
+            b"# test\n"
+            b"1 0.5 0.0 0.0 0.0 1.0 2.0 3.0 1 test.jpg\n"
+            b"100.0 200.0 5 300.0 400.0 999 500.0 600.0 -1\n"
         )
 
         kept_ids = {5}
         clean_points2d_refs(images_path, out_path, kept_ids)
 
-        content = out_path.read_text()
-        lines = [line for line in content.split("\n") if line and not line.startswith("#")]
-        pts_line = lines[1]
-        parts = pts_line.split()
-        assert parts[2] == "5"
-        assert parts[5] == "-1"
-        assert parts[8] == "-1"
+        parts = _POINTS2D_LINE_RE.search(out_path.read_bytes()).group(1).split()
+        assert parts[2] == b"5"
+        assert parts[5] == b"-1"
+        assert parts[8] == b"-1"
 
 
 class TestDebugJsonOutput:
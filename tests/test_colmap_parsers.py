@@ -2,10 +2,13 @@
 
 import struct
 
+import pytest
+
 from splatpipe.colmap.parsers import (
     parse_cameras_txt,
     parse_images_txt,
     parse_points3d_txt,
+    parse_points3d_txt_batches,
     count_cameras,
     count_images,
     count_points3d,
@@ -20,15 +23,17 @@ from splatpipe.colmap.parsers_bin import (
     parse_images_bin,
     parse_points3d_bin,
     convert_colmap_bin_to_txt,
+    write_images_txt,
 )
 
+pytestmark = pytest.mark.xdist_group("colmap_io")
+
 
 def test_parse_cameras_txt(tiny_cameras_path):
     """Verify camera model, params, count."""
-    cameras = list(parse_cameras_txt(tiny_cameras_path))
-    assert len(cameras) == 3
+    assert count_cameras(tiny_cameras_path) == 3
 
-    cam = cameras[0]
+    cam = next(parse_cameras_txt(tiny_cameras_path))
     assert cam["camera_id"] == 1
     assert cam["model"] == "RADIAL"
     assert cam["width"] == 4000
@@ -71,10 +76,12 @@ def test_parse_images_txt_streaming(tiny_images_path):
 
 def test_parse_points3d_streaming(tiny_points3d_path):
     """Verify ID, XYZ, RGB, track extraction."""
+    assert count_points3d(tiny_points3d_path) == 50
+
     points = list(parse_points3d_txt(tiny_points3d_path))
     assert len(points) == 50
-
     pt = points[0]
+    assert type(pt) is dict
     assert pt["point3d_id"] == 1
     assert abs(pt["x"] - (-1.234)) < 0.001
     assert abs(pt["y"] - 0.567) < 0.001
@@ -87,6 +94,38 @@ def test_parse_points3d_streaming(tiny_points3d_path):
     assert pt["track"][0] == {"image_id": 1, "point2d_idx": 0}
 
 
+def test_parse_points3d_batches_match_lines(tiny_points3d_path):
+    """Batched bulk parse agrees with a plain split of each line across batch edges."""
+    batches = list(parse_points3d_txt_batches(tiny_points3d_path, batch_size=16))
+    assert len(batches) > 1
+    points = [pt for _, arr in batches for pt in arr]
+    lines = [line for batch_lines, _ in batches for line in batch_lines]
+    assert len(points) == len(lines) == 50
+    for got, line in zip(points, lines):
+        parts = line.split()
+        assert got["point3d_id"] == int(parts[0])
+        assert (got["x"], got["y"], got["z"]) == tuple(float(p) for p in parts[1:4])
+        assert (got["r"], got["g"], got["b"]) == tuple(int(p) for p in parts[4:7])
+        assert got["error"] == float(parts[7])
+
+
+def test_parse_points3d_batches_skip_short_rows(tmp_path):
+    """Rows with fewer than 8 columns are skipped, not fatal to the batch."""
+    path = tmp_path / "points3D.txt"
+    path.write_bytes(
+        b"# header\n"
+        b"1 0.0 0.0 0.0 10 20 30 0.5 1 0\n"
+        b"2 1.0 2.0\n"
+        b"\n"
+        b"3 4.0 5.0 6.0 300 0 0 0.25\n"
+    )
+    (lines, points), = parse_points3d_txt_batches(path)
+    assert len(lines) == 2
+    assert points["point3d_id"].tolist() == [1, 3]
+    # Out-of-range colors survive as-is, as the per-line int() parse did
+    assert points["r"].tolist() == [10, 300]
+
+
 def test_comment_lines_preserved(tiny_cameras_path):
     """Comment lines are extracted correctly."""
     comments = stream_comment_lines(tiny_cameras_path)
@@ -106,58 +145,78 @@ def test_count_points3d(tiny_points3d_path):
     assert count_points3d(tiny_points3d_path) == 50
 
 
+@pytest.mark.parametrize("data, expected", [
+    (b"", 0),
+    (b"# only a comment\n", 0),
+    (b"1 0 0 0\n\n2 0 0 0", 2),  # blank line, no trailing newline
+    (b"# c\r\n1 0 0 0\r\n \t\r\n2 0 0 0\r\n", 2),  # CRLF + whitespace-only line
+    (b"1 0 0 0\n  # indented, not a comment\n", 2),
+])
+def test_count_points3d_line_edges(tmp_path, data, expected):
+    """mmap-based counting matches the line-iteration semantics."""
+    path = tmp_path / "points3D.txt"
+    path.write_bytes(data)
+    assert count_points3d(path) == expected
+
+
 # ── Binary parser helpers ────────────────────────────────────────
 
 
+_COUNT = struct.Struct("<Q")
+# camera_id, model_id, width, height, params
+_SIMPLE_PINHOLE = struct.Struct("<IiQQ3d")
+_PINHOLE = struct.Struct("<IiQQ4d")
+_IMAGE_HEADER = struct.Struct("<I4d3dI")  # image_id, qvec, tvec, camera_id
+_POINT2D = struct.Struct("<2dq")  # x, y, point3d_id (signed)
+# point3d_id, xyz, rgb, error, track_length=1, image_id, point2d_idx
+_PT3D_SINGLE = struct.Struct("<Q3d3BdQII")
+
+
 def _write_tiny_cameras_bin(path):
     """Write 2 cameras: SIMPLE_PINHOLE (model 0, 3 params) + PINHOLE (model 1, 4 params)."""
-    with open(path, "wb") as f:
-        f.write(struct.pack("<Q", 2))  # num_cameras
-        # Camera 1: SIMPLE_PINHOLE
-        f.write(struct.pack("<I", 1))  # camera_id
-        f.write(struct.pack("<i", 0))  # model_id = SIMPLE_PINHOLE
-        f.write(struct.pack("<Q", 1920))  # width
-        f.write(struct.pack("<Q", 1080))  # height
-        f.write(struct.pack("<3d", 1500.0, 960.0, 540.0))  # f, cx, cy
-        # Camera 2: PINHOLE
-        f.write(struct.pack("<I", 2))
-        f.write(struct.pack("<i", 1))  # model_id = PINHOLE
-        f.write(struct.pack("<Q", 4000))
-        f.write(struct.pack("<Q", 3000))
-        f.write(struct.pack("<4d", 3500.0, 3500.0, 2000.0, 1500.0))  # fx, fy, cx, cy
+    buf = bytearray(_COUNT.size + _SIMPLE_PINHOLE.size + _PINHOLE.size)
+    _COUNT.pack_into(buf, 0, 2)
+    _SIMPLE_PINHOLE.pack_into(buf, _COUNT.size, 1, 0, 1920, 1080, 1500.0, 960.0, 540.0)
+    _PINHOLE.pack_into(
+        buf, _COUNT.size + _SIMPLE_PINHOLE.size,
+        2, 1, 4000, 3000, 3500.0, 3500.0, 2000.0, 1500.0,
+    )
+    path.write_bytes(buf)
 
 
 def _write_tiny_images_bin(path, num_images=3):
     """Write N images with 2 POINTS2D each."""
-    with open(path, "wb") as f:
-        f.write(struct.pack("<Q", num_images))
-        for i in range(num_images):
-            f.write(struct.pack("<I", i + 1))  # image_id
-            f.write(struct.pack("<4d", 0.5, 0.5, 0.5, 0.5))  # qw, qx, qy, qz
-            f.write(struct.pack("<3d", float(i), float(i * 2), float(i * 3)))  # tx, ty, tz
-            f.write(struct.pack("<I", 1))  # camera_id
-            name = f"img_{i:03d}.jpg".encode() + b"\x00"
-            f.write(name)
-            # 2 POINTS2D per image
-            f.write(struct.pack("<Q", 2))
-            f.write(struct.pack("<2d", 100.0, 200.0))  # x, y
-            f.write(struct.pack("<q", i * 10))  # point3d_id (signed)
-            f.write(struct.pack("<2d", 300.0, 400.0))
-            f.write(struct.pack("<q", -1))  # unmatched
+    names = [f"img_{i:03d}.jpg".encode() + b"\x00" for i in range(num_images)]
+    fixed = _IMAGE_HEADER.size + _COUNT.size + 2 * _POINT2D.size
+    buf = bytearray(_COUNT.size + sum(fixed + len(n) for n in names))
+    _COUNT.pack_into(buf, 0, num_images)
+    off = _COUNT.size
+    for i, name in enumerate(names):
+        _IMAGE_HEADER.pack_into(
+            buf, off, i + 1, 0.5, 0.5, 0.5, 0.5, float(i), float(i * 2), float(i * 3), 1,
+        )
+        off += _IMAGE_HEADER.size
+        buf[off:off + len(name)] = name
+        off += len(name)
+        _COUNT.pack_into(buf, off, 2)  # 2 POINTS2D per image
+        off += _COUNT.size
+        _POINT2D.pack_into(buf, off, 100.0, 200.0, i * 10)
+        off += _POINT2D.size
+        _POINT2D.pack_into(buf, off, 300.0, 400.0, -1)  # unmatched
+        off += _POINT2D.size
+    path.write_bytes(buf)
 
 
 def _write_tiny_points3d_bin(path, num_points=5):
     """Write N points with 1-entry tracks."""
-    with open(path, "wb") as f:
-        f.write(struct.pack("<Q", num_points))
-        for i in range(num_points):
-            f.write(struct.pack("<Q", i + 1))  # point3d_id
-            f.write(struct.pack("<3d", float(i), float(i + 1), float(i + 2)))  # x, y, z
-            f.write(struct.pack("<3B", 128, 64, 32))  # r, g, b
-            f.write(struct.pack("<d", 0.5))  # error
-            f.write(struct.pack("<Q", 1))  # track_length
-            f.write(struct.pack("<I", 1))  # image_id
-            f.write(struct.pack("<I", i))  # point2d_idx
+    buf = bytearray(_COUNT.size + num_points * _PT3D_SINGLE.size)
+    _COUNT.pack_into(buf, 0, num_points)
+    for i in range(num_points):
+        _PT3D_SINGLE.pack_into(
+            buf, _COUNT.size + i * _PT3D_SINGLE.size,
+            i + 1, float(i), float(i + 1), float(i + 2), 128, 64, 32, 0.5, 1, 1, i,
+        )
+    path.write_bytes(buf)
 
 
 # ── Binary parser tests ──────────────────────────────────────────
@@ -192,6 +251,37 @@ def test_parse_images_bin(tmp_path):
     assert images[2]["name"] == "img_002.jpg"
 
 
+def test_parse_images_bin_points2d_outlive_map(tmp_path):
+    """points2d records stay valid after an early-closed parser unmaps the file."""
+    path = tmp_path / "images.bin"
+    _write_tiny_images_bin(path, num_images=3)
+    gen = parse_images_bin(path)
+    first = next(gen)
+    gen.close()
+    assert first["points2d"] == [
+        {"x": 100.0, "y": 200.0, "point3d_id": 0},
+        {"x": 300.0, "y": 400.0, "point3d_id": -1},
+    ]
+
+
+def test_write_images_txt_roundtrip_bytes(tmp_path):
+    """images.bin -> text -> text is byte-identical and writes plain numbers."""
+    bin_path = tmp_path / "images.bin"
+    _write_tiny_images_bin(bin_path, num_images=2)
+    from_bin = tmp_path / "from_bin.txt"
+    from_txt = tmp_path / "from_txt.txt"
+    assert write_images_txt(parse_images_bin(bin_path), from_bin) == 2
+    assert write_images_txt(parse_images_txt(from_bin), from_txt) == 2
+
+    assert from_txt.read_bytes() == from_bin.read_bytes()
+    assert from_bin.read_bytes().splitlines()[3:] == [
+        b"1 0.5 0.5 0.5 0.5 0.0 0.0 0.0 1 img_000.jpg",
+        b"100.0 200.0 0 300.0 400.0 -1",
+        b"2 0.5 0.5 0.5 0.5 1.0 2.0 3.0 1 img_001.jpg",
+        b"100.0 200.0 10 300.0 400.0 -1",
+    ]
+
+
 def test_parse_points3d_bin(tmp_path):
     path = tmp_path / "points3D.bin"
     _write_tiny_points3d_bin(path, num_points=5)
@@ -237,54 +327,37 @@ def test_convert_bin_to_txt_roundtrip(tmp_path):
 # ── Format detection tests ───────────────────────────────────────
 
 
-def test_detect_colmap_format_text(tmp_path):
-    for f in ("cameras.txt", "images.txt", "points3D.txt"):
-        (tmp_path / f).touch()
-    assert detect_colmap_format(tmp_path) == "text"
-
-
-def test_detect_colmap_format_binary(tmp_path):
-    for f in ("cameras.bin", "images.bin", "points3D.bin"):
-        (tmp_path / f).touch()
-    assert detect_colmap_format(tmp_path) == "binary"
-
-
-def test_detect_colmap_format_unknown(tmp_path):
-    assert detect_colmap_format(tmp_path) == "unknown"
-
-
-def test_detect_alignment_format_colmap_text(tmp_path):
-    for f in ("cameras.txt", "images.txt", "points3D.txt"):
-        (tmp_path / f).touch()
-    assert detect_alignment_format(tmp_path) == "colmap_text"
-
-
-def test_detect_alignment_format_colmap_binary(tmp_path):
-    for f in ("cameras.bin", "images.bin", "points3D.bin"):
-        (tmp_path / f).touch()
-    assert detect_alignment_format(tmp_path) == "colmap_binary"
-
-
-def test_detect_alignment_format_bundler(tmp_path):
-    (tmp_path / "bundle.out").touch()
-    (tmp_path / "cloud.ply").touch()
-    assert detect_alignment_format(tmp_path) == "bundler"
+def _touch_all(dirpath, names):
+    """Create empty files — detection only looks at names."""
+    for name in names:
+        (dirpath / name).touch()
 
 
-def test_detect_alignment_format_realityscan(tmp_path):
-    (tmp_path / "registration.csv").touch()
-    (tmp_path / "cloud.ply").touch()
-    assert detect_alignment_format(tmp_path) == "realityscan"
+_COLMAP_TEXT = ("cameras.txt", "images.txt", "points3D.txt")
+_COLMAP_BIN = ("cameras.bin", "images.bin", "points3D.bin")
 
 
-def test_detect_alignment_format_blocksexchange(tmp_path):
-    (tmp_path / "alignment.xml").touch()
-    assert detect_alignment_format(tmp_path) == "blocksexchange"
+@pytest.mark.parametrize("files,expected", [
+    (_COLMAP_TEXT, "text"),
+    (_COLMAP_BIN, "binary"),
+    ((), "unknown"),
+])
+def test_detect_colmap_format(tmp_path, files, expected):
+    _touch_all(tmp_path, files)
+    assert detect_colmap_format(tmp_path) == expected
 
 
-def test_detect_alignment_format_unknown(tmp_path):
-    (tmp_path / "random.dat").touch()
-    assert detect_alignment_format(tmp_path) == "unknown"
+@pytest.mark.parametrize("files,expected", [
+    (_COLMAP_TEXT, "colmap_text"),
+    (_COLMAP_BIN, "colmap_binary"),
+    (("bundle.out", "cloud.ply"), "bundler"),
+    (("registration.csv", "cloud.ply"), "realityscan"),
+    (("alignment.xml",), "blocksexchange"),
+    (("random.dat",), "unknown"),
+])
+def test_detect_alignment_format(tmp_path, files, expected):
+    _touch_all(tmp_path, files)
+    assert detect_alignment_format(tmp_path) == expected
 
 
 def test_alignment_format_labels_complete():
@@ -306,9 +379,7 @@ def test_detect_source_type_psht_file(tmp_path):
 
 def test_detect_source_type_directory(tmp_path):
     """detect_source_type delegates to detect_alignment_format for directories."""
-    (tmp_path / "cameras.txt").touch()
-    (tmp_path / "images.txt").touch()
-    (tmp_path / "points3D.txt").touch()
+    _touch_all(tmp_path, _COLMAP_TEXT)
     assert detect_source_type(tmp_path) == "colmap_text"
 
 
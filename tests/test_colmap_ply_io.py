@@ -1,8 +1,11 @@
 """Tests for binary PLY reader."""
 
-import struct
+from types import SimpleNamespace
 
+import numpy as np
+import pytest
 
+from splatpipe.colmap import ply_io
 from splatpipe.colmap.ply_io import read_binary_ply, ply_vertices_to_colmap_coords
 
 
@@ -40,35 +43,82 @@ def test_ply_to_colmap_transform(tiny_ply_path):
     assert abs(colmap_coords[0, 2] - 1.890) < 0.001
 
 
+def test_ply_to_colmap_general_transform(tiny_ply_path):
+    """Non-permutation transforms go through the full matrix product."""
+    vertices = read_binary_ply(tiny_ply_path)
+    transform = (0.5, 0, 0, 0, 2, 0, 1, 0, 1)
+    xyz = np.column_stack([vertices[a].astype(np.float64) for a in "xyz"])
+    expected = xyz @ np.array(transform, dtype=np.float64).reshape(3, 3).T
+    assert np.allclose(ply_vertices_to_colmap_coords(vertices, transform), expected)
+
+
 def test_ply_header_parsing(tmp_path):
     """Various PLY headers: with normals, extra properties."""
     # PLY with normals
     ply_path = tmp_path / "normals.ply"
-    with open(ply_path, "wb") as f:
-        header = (
-            "ply\n"
-            "format binary_little_endian 1.0\n"
-            "element vertex 2\n"
-            "property float x\n"
-            "property float y\n"
-            "property float z\n"
-            "property float nx\n"
-            "property float ny\n"
-            "property float nz\n"
-            "property uchar red\n"
-            "property uchar green\n"
-            "property uchar blue\n"
-            "end_header\n"
-        )
-        f.write(header.encode("ascii"))
-        for i in range(2):
-            f.write(struct.pack("<ffffffBBB",
-                                float(i), float(i + 1), float(i + 2),
-                                0.0, 0.0, 1.0,
-                                128, 128, 128))
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        "element vertex 2\n"
+        "property float x\n"
+        "property float y\n"
+        "property float z\n"
+        "property float nx\n"
+        "property float ny\n"
+        "property float nz\n"
+        "property uchar red\n"
+        "property uchar green\n"
+        "property uchar blue\n"
+        "end_header\n"
+    )
+    body = np.zeros(2, dtype=[
+        ("x", "<f4"), ("y", "<f4"), ("z", "<f4"),
+        ("nx", "<f4"), ("ny", "<f4"), ("nz", "<f4"),
+        ("red", "u1"), ("green", "u1"), ("blue", "u1"),
+    ])
+    body["x"] = np.arange(2)
+    body["y"] = body["x"] + 1
+    body["z"] = body["x"] + 2
+    body["nz"] = 1.0
+    body["red"] = body["green"] = body["blue"] = 128
+    ply_path.write_bytes(header.encode("ascii") + body.tobytes())
 
     vertices = read_binary_ply(ply_path)
     assert len(vertices) == 2
     assert "nx" in vertices.dtype.names
     assert abs(vertices["x"][0] - 0.0) < 0.001
     assert abs(vertices["x"][1] - 1.0) < 0.001
+
+
+def test_miniply_matches_numpy_reader(tiny_ply_path, monkeypatch):
+    """Native pyminiply decode yields the same structured array as numpy."""
+    pytest.importorskip("pyminiply")
+    native = read_binary_ply(tiny_ply_path)
+    monkeypatch.setattr(ply_io, "pyminiply", None)
+    fallback = read_binary_ply(tiny_ply_path)
+    assert native.dtype == fallback.dtype
+    assert np.array_equal(native, fallback)
+
+
+@pytest.mark.parametrize("reader", ["numpy", "pyminiply"])
+def test_truncated_ply_raises(tiny_ply_path, tmp_path, monkeypatch, reader):
+    """A vertex block shorter than the header's count fails loudly with either reader."""
+    if reader == "numpy":
+        monkeypatch.setattr(ply_io, "pyminiply", None)
+    else:
+        pytest.importorskip("pyminiply")
+    truncated = tmp_path / "truncated.ply"
+    truncated.write_bytes(tiny_ply_path.read_bytes()[:-15])
+    with pytest.raises(ValueError, match="Truncated PLY"):
+        read_binary_ply(truncated)
+
+
+def test_miniply_unexpected_color_dtype_raises(tiny_ply_path, monkeypatch):
+    """Colors that aren't uchar are rejected rather than cast into the vertex array."""
+    def fake_read(path, read_normals, read_uv, read_color):
+        xyz = np.zeros((20, 3), dtype=np.float32)
+        return xyz, None, np.empty((0, 3), np.float32), None, np.zeros((20, 3), np.float32)
+
+    monkeypatch.setattr(ply_io, "pyminiply", SimpleNamespace(read=fake_read))
+    with pytest.raises(ValueError, match="float32 colors"):
+        read_binary_ply(tiny_ply_path)
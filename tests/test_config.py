@@ -21,11 +21,10 @@ def test_project_override(tmp_path):
     import tomli_w
 
     project_toml = tmp_path / "project.toml"
-    with open(project_toml, "wb") as f:
-        tomli_w.dump({
-            "colmap_clean": {"kdtree_threshold": 0.005},
-            "custom_key": "hello",
-        }, f)
+    project_toml.write_bytes(tomli_w.dumps({
+        "colmap_clean": {"kdtree_threshold": 0.005},
+        "custom_key": "hello",
+    }).encode("utf-8"))
 
     config = load_project_config(project_toml)
     # Overridden value
@@ -1,5 +1,6 @@
 """Extended tests for config helpers: tool path resolution, save/roundtrip, deep merge."""
 
+import os
 import tomllib
 
 import pytest
@@ -78,8 +79,9 @@ class TestSaveDefaults:
         """save_defaults writes valid TOML that load_defaults reads back."""
         toml_path = tmp_path / "defaults.toml"
         # Write initial config
-        with open(toml_path, "wb") as f:
-            tomli_w.dump({"tools": {}, "colmap_clean": {"kdtree_threshold": 0.001}}, f)
+        toml_path.write_bytes(tomli_w.dumps(
+            {"tools": {}, "colmap_clean": {"kdtree_threshold": 0.001}},
+        ).encode("utf-8"))
 
         monkeypatch.setattr("splatpipe.core.config.DEFAULTS_PATH", toml_path)
 
@@ -92,6 +94,18 @@ class TestSaveDefaults:
         assert reloaded["colmap_clean"]["kdtree_threshold"] == 0.005
         assert reloaded["new_section"]["key"] == "value"
 
+    def test_load_returns_independent_copies(self, tmp_path, monkeypatch):
+        """Cached defaults are handed out as copies; mutating one leaks nowhere."""
+        toml_path = tmp_path / "defaults.toml"
+        toml_path.write_bytes(
+            tomli_w.dumps({"colmap_clean": {"kdtree_threshold": 0.001}}).encode("utf-8"),
+        )
+        monkeypatch.setattr("splatpipe.core.config.DEFAULTS_PATH", toml_path)
+
+        first = load_defaults()
+        first["colmap_clean"]["kdtree_threshold"] = 0.5
+        assert load_defaults()["colmap_clean"]["kdtree_threshold"] == 0.001
+
 
 class TestSaveProjectConfig:
     def test_roundtrip(self, tmp_path):
@@ -105,6 +119,19 @@ class TestSaveProjectConfig:
         assert reloaded["postshot"]["profile"] == "Splat MCMC"
         assert reloaded["custom"]["flag"] is True
 
+    def test_unchanged_config_not_rewritten(self, tmp_path):
+        """Saving identical content leaves the file (and its mtime) untouched."""
+        toml_path = tmp_path / "project.toml"
+        config = {"postshot": {"profile": "Splat MCMC"}}
+        save_project_config(toml_path, config)
+        os.utime(toml_path, ns=(0, 0))
+
+        save_project_config(toml_path, config)
+        assert toml_path.stat().st_mtime_ns == 0
+
+        save_project_config(toml_path, {"postshot": {"profile": "Splat3"}})
+        assert toml_path.stat().st_mtime_ns != 0
+
 
 # --- check_dependencies ---
 
@@ -123,6 +150,12 @@ class TestCheckDependencies:
         assert "numpy" in result
         assert "tomli_w" in result
 
+    def test_returns_independent_copy(self):
+        """The cached result is copied; mutating it doesn't affect later calls."""
+        first = check_dependencies()
+        first["numpy"] = False
+        assert check_dependencies()["numpy"] is True
+
 
 # --- _deep_merge ---
 
@@ -44,8 +44,7 @@ def dcc_env(tmp_path, monkeypatch):
         "lichtfeld": {"strategy": "mcmc", "iterations": 30000},
         "paths": {"projects_root": str(projects_root)},
     }
-    with open(toml_path, "wb") as f:
-        tomli_w.dump(config, f)
+    toml_path.write_bytes(tomli_w.dumps(config).encode("utf-8"))
     monkeypatch.setattr("splatpipe.core.config.DEFAULTS_PATH", toml_path)
 
     proj_dir = projects_root / "DccTestProject"
@@ -97,8 +97,7 @@ class TestLoadBunnyEnv:
                 "cdn_url": "https://toml-cdn.example.com",
             },
         }
-        with open(toml_path, "wb") as f:
-            tomli_w.dump(config, f)
+        toml_path.write_bytes(tomli_w.dumps(config).encode("utf-8"))
         monkeypatch.setattr("splatpipe.core.config.DEFAULTS_PATH", toml_path)
         # Clear any env vars
         monkeypatch.delenv("BUNNY_STORAGE_ZONE", raising=False)
@@ -120,8 +119,7 @@ class TestLoadBunnyEnv:
                 "cdn_url": "https://toml-cdn.example.com",
             },
         }
-        with open(toml_path, "wb") as f:
-            tomli_w.dump(config, f)
+        toml_path.write_bytes(tomli_w.dumps(config).encode("utf-8"))
         monkeypatch.setattr("splatpipe.core.config.DEFAULTS_PATH", toml_path)
         monkeypatch.delenv("BUNNY_STORAGE_ZONE", raising=False)
         monkeypatch.delenv("BUNNY_STORAGE_PASSWORD", raising=False)
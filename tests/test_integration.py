@@ -1,56 +1,94 @@
 """Integration tests: end-to-end on tiny test data."""
 
+import functools
 import json
 import shutil
 import struct
 from pathlib import Path
 
+import pytest
 
 from splatpipe.core.constants import FOLDER_COLMAP_SOURCE, FOLDER_COLMAP_CLEAN
 from splatpipe.core.config import load_defaults
 from splatpipe.core.project import Project
 from splatpipe.steps.colmap_clean import ColmapCleanStep
-from splatpipe.colmap.parsers import parse_cameras_txt, parse_images_txt
+from splatpipe.colmap.parsers import parse_cameras_txt, parse_images_txt, parse_points3d_txt
+from splatpipe.colmap.parsers_bin import CAMERA_MODELS
 
 TEST_DATA = Path(__file__).parent / "test_data"
 
+# Fixed-size record prefixes of the COLMAP binary format (see parsers_bin)
+_COUNT = struct.Struct("<Q")
+_IMG_HDR = struct.Struct("<I4d3dI")
+_POINT2D = struct.Struct("<2dq")
+# points3D.bin record header; a TRACK[] of <u4 (image_id, point2d_idx) pairs follows
+_PT3D_HDR = struct.Struct("<Q3d3BdQ")
+_MODEL_IDS = {name: model_id for model_id, (name, _) in CAMERA_MODELS.items()}
 
-class TestColmapCleanIntegration:
-    """End-to-end test of the COLMAP clean step with real tiny data."""
 
-    def _setup_project(self, tmp_path) -> Project:
-        """Create a project with test COLMAP data."""
-        project = Project.create(tmp_path / "proj", "IntegTest")
+@functools.lru_cache
+def _camera_struct(num_params: int) -> struct.Struct:
+    """Whole camera record (header + PARAMS[]) for a given parameter count."""
+    return struct.Struct(f"<IiQQ{num_params}d")
 
-        colmap_dir = project.get_folder(FOLDER_COLMAP_SOURCE)
-        colmap_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy(TEST_DATA / "tiny_cameras.txt", colmap_dir / "cameras.txt")
-        shutil.copy(TEST_DATA / "tiny_images.txt", colmap_dir / "images.txt")
-        shutil.copy(TEST_DATA / "tiny_points3d.txt", colmap_dir / "points3D.txt")
-        shutil.copy(TEST_DATA / "tiny_cloud.ply", colmap_dir / "cloud.ply")
 
-        return project
+@functools.lru_cache(maxsize=1)
+def _tiny_text_model() -> tuple[tuple, tuple, tuple]:
+    """Parsed tiny text COLMAP model (cameras, images, points), parsed once. Do not mutate."""
+    return (
+        tuple(parse_cameras_txt(TEST_DATA / "tiny_cameras.txt")),
+        tuple(parse_images_txt(TEST_DATA / "tiny_images.txt")),
+        tuple(parse_points3d_txt(TEST_DATA / "tiny_points3d.txt")),
+    )
 
-    def test_colmap_clean_produces_output(self, tmp_path):
-        """COLMAP clean step produces all output files."""
-        project = self._setup_project(tmp_path)
-        config = load_defaults()
 
-        step = ColmapCleanStep(project, config)
-        step.execute()
+def _run_clean(root: Path, *, fixed_threshold: bool) -> tuple[Project, dict]:
+    """Create a project with test COLMAP data and run the clean step once."""
+    project = Project.create(root / "proj", "IntegTest")
+
+    colmap_dir = project.get_folder(FOLDER_COLMAP_SOURCE)
+    shutil.copy(TEST_DATA / "tiny_cameras.txt", colmap_dir / "cameras.txt")
+    shutil.copy(TEST_DATA / "tiny_images.txt", colmap_dir / "images.txt")
+    shutil.copy(TEST_DATA / "tiny_points3d.txt", colmap_dir / "points3D.txt")
+    shutil.copy(TEST_DATA / "tiny_cloud.ply", colmap_dir / "cloud.ply")
+
+    config = load_defaults()
+    if fixed_threshold:
+        # Use fixed threshold for tiny test data (auto doesn't work with 5 cameras)
+        config["colmap_clean"]["outlier_threshold_auto"] = False
+        config["colmap_clean"]["outlier_threshold_fixed"] = 100.0
+
+    result = ColmapCleanStep(project, config).execute()
+    return project, result
+
+
+@pytest.fixture(scope="class")
+def auto_cleaned(tmp_path_factory):
+    """Clean step run once with default (auto-threshold) config. Read-only."""
+    return _run_clean(tmp_path_factory.mktemp("clean_auto"), fixed_threshold=False)
+
+
+@pytest.fixture(scope="class")
+def fixed_cleaned(tmp_path_factory):
+    """Clean step run once with a fixed 100.0 outlier threshold. Read-only."""
+    return _run_clean(tmp_path_factory.mktemp("clean_fixed"), fixed_threshold=True)
+
+
+class TestColmapCleanIntegration:
+    """End-to-end test of the COLMAP clean step with real tiny data."""
+
+    def test_colmap_clean_produces_output(self, auto_cleaned):
+        """COLMAP clean step produces all output files."""
+        project, _ = auto_cleaned
 
         clean_dir = project.get_folder(FOLDER_COLMAP_CLEAN)
         assert (clean_dir / "cameras.txt").exists()
         assert (clean_dir / "images.txt").exists()
         assert (clean_dir / "points3D.txt").exists()
 
-    def test_colmap_clean_debug_json(self, tmp_path):
+    def test_colmap_clean_debug_json(self, auto_cleaned):
         """COLMAP clean step produces valid debug JSON."""
-        project = self._setup_project(tmp_path)
-        config = load_defaults()
-
-        step = ColmapCleanStep(project, config)
-        step.execute()
+        project, _ = auto_cleaned
 
         debug_path = project.get_folder(FOLDER_COLMAP_CLEAN) / "clean_debug.json"
         assert debug_path.exists()
@@ -65,16 +103,9 @@ class TestColmapCleanIntegration:
         assert "environment" in debug
         assert "summary" in debug
 
-    def test_colmap_clean_filters_correctly(self, tmp_path):
+    def test_colmap_clean_filters_correctly(self, fixed_cleaned):
         """COLMAP clean removes outliers and filters points."""
-        project = self._setup_project(tmp_path)
-        config = load_defaults()
-        # Use fixed threshold for tiny test data (auto doesn't work with 5 cameras)
-        config["colmap_clean"]["outlier_threshold_auto"] = False
-        config["colmap_clean"]["outlier_threshold_fixed"] = 100.0
-
-        step = ColmapCleanStep(project, config)
-        result = step.execute()
+        _, result = fixed_cleaned
 
         summary = result["summary"]
         # 2 outlier cameras removed (image004.jpg, image005.jpg)
@@ -83,15 +114,9 @@ class TestColmapCleanIntegration:
         # 20 points kept (matched PLY), 30 removed
         assert summary["points_after"] == 20
 
-    def test_colmap_clean_updates_state(self, tmp_path):
+    def test_colmap_clean_updates_state(self, fixed_cleaned):
         """State is updated to completed after successful clean."""
-        project = self._setup_project(tmp_path)
-        config = load_defaults()
-        config["colmap_clean"]["outlier_threshold_auto"] = False
-        config["colmap_clean"]["outlier_threshold_fixed"] = 100.0
-
-        step = ColmapCleanStep(project, config)
-        step.execute()
+        project, _ = fixed_cleaned
 
         assert project.get_step_status("clean") == "completed"
         summary = project.get_step_summary("clean")
@@ -102,62 +127,46 @@ class TestColmapCleanIntegration:
 class TestColmapCleanBinaryInput:
     """Test clean step with binary COLMAP input."""
 
-    def _write_binary_from_text(self, text_dir: Path, bin_dir: Path) -> None:
+    def _write_binary_from_text(self, bin_dir: Path) -> None:
         """Convert tiny text test data to binary format for testing."""
-        from splatpipe.colmap.parsers import parse_points3d_txt
-        # Read text data (test files use "tiny_" prefix)
-        cameras = list(parse_cameras_txt(text_dir / "tiny_cameras.txt"))
-        images = list(parse_images_txt(text_dir / "tiny_images.txt"))
-        points = list(parse_points3d_txt(text_dir / "tiny_points3d.txt"))
-
-        # Write binary files
+        cameras, images, points = _tiny_text_model()
         self._write_cameras_bin(bin_dir / "cameras.bin", cameras)
         self._write_images_bin(bin_dir / "images.bin", images)
         self._write_points3d_bin(bin_dir / "points3D.bin", points)
 
     def _write_cameras_bin(self, path, cameras):
-        MODELS_INV = {
-            "SIMPLE_PINHOLE": 0, "PINHOLE": 1, "SIMPLE_RADIAL": 2,
-            "RADIAL": 3, "OPENCV": 4, "OPENCV_FISHEYE": 5,
-            "FULL_OPENCV": 6, "FOV": 7, "SIMPLE_RADIAL_FISHEYE": 8,
-            "RADIAL_FISHEYE": 9, "THIN_PRISM_FISHEYE": 10,
-        }
-        with open(path, "wb") as f:
-            f.write(struct.pack("<Q", len(cameras)))
-            for cam in cameras:
-                f.write(struct.pack("<I", cam["camera_id"]))
-                f.write(struct.pack("<i", MODELS_INV[cam["model"]]))
-                f.write(struct.pack("<Q", cam["width"]))
-                f.write(struct.pack("<Q", cam["height"]))
-                for p in cam["params"]:
-                    f.write(struct.pack("<d", p))
+        buf = bytearray(_COUNT.pack(len(cameras)))
+        for cam in cameras:
+            params = cam["params"]
+            buf += _camera_struct(len(params)).pack(
+                cam["camera_id"], _MODEL_IDS[cam["model"]], cam["width"], cam["height"],
+                *params,
+            )
+        path.write_bytes(buf)
 
     def _write_images_bin(self, path, images):
-        with open(path, "wb") as f:
-            f.write(struct.pack("<Q", len(images)))
-            for img in images:
-                f.write(struct.pack("<I", img["image_id"]))
-                f.write(struct.pack("<4d", img["qw"], img["qx"], img["qy"], img["qz"]))
-                f.write(struct.pack("<3d", img["tx"], img["ty"], img["tz"]))
-                f.write(struct.pack("<I", img["camera_id"]))
-                f.write(img["name"].encode() + b"\x00")
-                f.write(struct.pack("<Q", len(img["points2d"])))
-                for p in img["points2d"]:
-                    f.write(struct.pack("<2d", p["x"], p["y"]))
-                    f.write(struct.pack("<q", p["point3d_id"]))
+        buf = bytearray(_COUNT.pack(len(images)))
+        for img in images:
+            buf += _IMG_HDR.pack(
+                img["image_id"], img["qw"], img["qx"], img["qy"], img["qz"],
+                img["tx"], img["ty"], img["tz"], img["camera_id"],
+            )
+            buf += img["name"].encode() + b"\x00"
+            buf += _COUNT.pack(len(img["points2d"]))
+            for p in img["points2d"]:
+                buf += _POINT2D.pack(p["x"], p["y"], p["point3d_id"])
+        path.write_bytes(buf)
 
     def _write_points3d_bin(self, path, points):
-        with open(path, "wb") as f:
-            f.write(struct.pack("<Q", len(points)))
-            for pt in points:
-                f.write(struct.pack("<Q", pt["point3d_id"]))
-                f.write(struct.pack("<3d", pt["x"], pt["y"], pt["z"]))
-                f.write(struct.pack("<3B", pt["r"], pt["g"], pt["b"]))
-                f.write(struct.pack("<d", pt["error"]))
-                f.write(struct.pack("<Q", len(pt["track"])))
-                for t in pt["track"]:
-                    f.write(struct.pack("<I", t["image_id"]))
-                    f.write(struct.pack("<I", t["point2d_idx"]))
+        buf = bytearray(_COUNT.pack(len(points)))
+        for pt in points:
+            track = [v for t in pt["track"] for v in (t["image_id"], t["point2d_idx"])]
+            buf += _PT3D_HDR.pack(
+                pt["point3d_id"], pt["x"], pt["y"], pt["z"],
+                pt["r"], pt["g"], pt["b"], pt["error"], len(pt["track"]),
+            )
+            buf += struct.pack(f"<{len(track)}I", *track)
+        path.write_bytes(buf)
 
     def test_clean_step_binary_input(self, tmp_path):
         """Clean step converts binary input to text and produces correct output."""
@@ -165,8 +174,7 @@ class TestColmapCleanBinaryInput:
 
         # Write binary COLMAP files from our tiny text test data
         colmap_dir = project.get_folder(FOLDER_COLMAP_SOURCE)
-        colmap_dir.mkdir(parents=True, exist_ok=True)
-        self._write_binary_from_text(TEST_DATA, colmap_dir)
+        self._write_binary_from_text(colmap_dir)
         shutil.copy(TEST_DATA / "tiny_cloud.ply", colmap_dir / "cloud.ply")
 
         config = load_defaults()
@@ -1,501 +1,236 @@
 """Tests for LOD assembly step — mock subprocess."""
 
+import json
+import os
+import shutil
 import struct
+import subprocess
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from splatpipe.core.constants import FOLDER_OUTPUT, FOLDER_REVIEW
+from splatpipe.core.project import Project
 from splatpipe.steps.lod_assembly import LodAssemblyStep
 
+# One worker builds the session templates once instead of once per worker
+pytestmark = pytest.mark.xdist_group("lod_assembly")
 
-def _create_fake_ply(path: Path) -> None:
-    """Create a minimal PLY file for testing."""
-    with open(path, "wb") as f:
-        header = (
-            "ply\n"
-            "format binary_little_endian 1.0\n"
-            "element vertex 1\n"
-            "property float x\n"
-            "property float y\n"
-            "property float z\n"
-            "property uchar red\n"
-            "property uchar green\n"
-            "property uchar blue\n"
-            "end_header\n"
-        )
-        f.write(header.encode("ascii"))
-        f.write(struct.pack("<fffBBB", 0.0, 0.0, 0.0, 128, 128, 128))
 
+# Minimal one-vertex binary PLY, rendered once at import
+_FAKE_PLY_BYTES = (
+    b"ply\n"
+    b"format binary_little_endian 1.0\n"
+    b"element vertex 1\n"
+    b"property float x\n"
+    b"property float y\n"
+    b"property float z\n"
+    b"property uchar red\n"
+    b"property uchar green\n"
+    b"property uchar blue\n"
+    b"end_header\n"
+    + struct.pack("<fffBBB", 0.0, 0.0, 0.0, 128, 128, 128)
+)
 
-class TestLodAssembly:
-    def test_no_reviewed_plys_raises(self, tmp_path):
-        """Missing reviewed PLYs raises FileNotFoundError."""
-        from splatpipe.core.project import Project
 
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
+def _create_fake_ply(path: Path) -> None:
+    """Create a minimal PLY file for testing."""
+    path.write_bytes(_FAKE_PLY_BYTES)
 
-        step = LodAssemblyStep(project, config)
 
-        with pytest.raises(FileNotFoundError, match="No reviewed PLY"):
-            step.run(project.get_folder("05_output"))
+@pytest.fixture(scope="session")
+def _project_template(tmp_path_factory) -> Path:
+    """Project scaffolding with one reviewed PLY, built once per session."""
+    project = Project.create(tmp_path_factory.mktemp("tpl") / "proj", "MyProject")
+    _create_fake_ply(project.get_folder(FOLDER_REVIEW) / "lod0_reviewed.ply")
+    return project.root
 
-    def test_assembly_with_reviewed_plys(self, tmp_path):
-        """Assembly runs splat-transform with correct interleaved args."""
-        from splatpipe.core.project import Project
 
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
+@pytest.fixture
+def assembly_project(tmp_path, _project_template) -> Project:
+    """Fresh per-test copy of the template project."""
+    root = shutil.copytree(_project_template, tmp_path / "proj")
+    return Project(root)
 
-        # Create reviewed PLYs
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        for i in range(5):
-            _create_fake_ply(review_dir / f"lod{i}_reviewed.ply")
 
-        step = LodAssemblyStep(project, config)
+_CONFIG = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            result = step.run(output_dir)
+def _completed(returncode: int = 0) -> MagicMock:
+    """Fake subprocess.run result for splat-transform."""
+    ok = returncode == 0
+    return MagicMock(returncode=returncode, stdout="Done" if ok else "", stderr="" if ok else "Error")
 
-        assert result["summary"]["lod_count"] == 5
-        # Verify the command has interleaved -l flags
-        call_cmd = mock_run.call_args[0][0]
-        assert "--filter-nan" in call_cmd
-        assert call_cmd[-1].endswith("lod-meta.json")
-        # Check -l 0 through -l 4 are present
-        for i in range(5):
-            assert "-l" in call_cmd
-            assert str(i) in call_cmd
 
-    def test_assembly_generates_viewer_html(self, tmp_path):
-        """Assembly generates index.html viewer when splat-transform succeeds."""
-        from splatpipe.core.project import Project
+def _run_assembly(project: Project) -> dict:
+    """Run LodAssemblyStep into the project's 05_output (subprocess.run must be mocked)."""
+    return LodAssemblyStep(project, _CONFIG).run(project.get_folder(FOLDER_OUTPUT))
 
-        project = Project.create(tmp_path / "proj", "MyProject")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
 
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
+@pytest.fixture(scope="session")
+def assembled_output(tmp_path_factory, _project_template) -> Path:
+    """05_output of the template project after one successful assembly. Do not mutate."""
+    root = shutil.copytree(_project_template, tmp_path_factory.mktemp("assembled") / "proj")
+    project = Project(root)
+    with patch("subprocess.run", return_value=_completed()):
+        _run_assembly(project)
+    return project.get_folder(FOLDER_OUTPUT)
 
-        step = LodAssemblyStep(project, config)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
+@pytest.fixture(scope="session")
+def viewer_html(assembled_output) -> bytes:
+    """Raw index.html bytes; needles are matched without decoding."""
+    return (assembled_output / "index.html").read_bytes()
 
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
 
-        viewer = output_dir / "index.html"
-        assert viewer.exists()
-        html = viewer.read_text(encoding="utf-8")
-        assert "MyProject" in html
-        assert "lod-meta.json" in html
-        assert "playcanvas" in html
-        assert "unified: true" in html
+@pytest.fixture(scope="session")
+def _assets_template(tmp_path_factory) -> Path:
+    """Project assets/ tree with one audio file, built once per session."""
+    assets = tmp_path_factory.mktemp("assets")
+    (assets / "audio").mkdir()
+    (assets / "audio" / "test.mp3").write_bytes(b"fake")
+    return assets
 
-    def test_assembly_includes_filter_harmonics(self, tmp_path):
-        """Assembly passes --filter-harmonics from step_settings."""
-        from splatpipe.core.project import Project
 
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
+class TestLodAssembly:
+    @pytest.fixture(autouse=True)
+    def mock_run(self, monkeypatch) -> MagicMock:
+        """subprocess.run replaced by a successful splat-transform run in every test."""
+        m = MagicMock(return_value=_completed())
+        monkeypatch.setattr(subprocess, "run", m)
+        return m
 
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
+    def test_no_reviewed_plys_raises(self, tmp_path):
+        """Missing reviewed PLYs raises FileNotFoundError."""
+        project = Project.create(tmp_path / "proj", "Test")
+        step = LodAssemblyStep(project, _CONFIG)
 
-        # Set SH bands to 2 via step_settings
-        project.set_step_settings("assemble", {"sh_bands": 2})
+        with pytest.raises(FileNotFoundError, match="No reviewed PLY"):
+            step.run(project.get_folder(FOLDER_OUTPUT))
 
-        step = LodAssemblyStep(project, config)
+    def test_assembly_with_reviewed_plys(self, assembly_project, mock_run):
+        """Assembly runs splat-transform with correct interleaved args."""
+        project = assembly_project
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
+        # lod0 comes from the template; hardlink it as lod1-lod4
+        review_dir = project.get_folder(FOLDER_REVIEW)
+        for i in range(1, 5):
+            os.link(review_dir / "lod0_reviewed.ply", review_dir / f"lod{i}_reviewed.ply")
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
+        result = _run_assembly(project)
 
+        assert result["summary"]["lod_count"] == 5
+        # Verify the command has interleaved -l flags
         call_cmd = mock_run.call_args[0][0]
-        # --filter-harmonics 2 should appear in the command
-        idx = call_cmd.index("--filter-harmonics")
-        assert call_cmd[idx + 1] == "2"
-
-    def test_assembly_filter_harmonics_default(self, tmp_path):
-        """Assembly defaults to --filter-harmonics 3 when no step_settings."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
+        argv = set(call_cmd)
+        assert "--filter-nan" in argv
+        assert call_cmd[-1].endswith("lod-meta.json")
+        # Check -l 0 through -l 4 are present
+        assert "-l" in argv
+        assert argv >= {str(i) for i in range(5)}
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
+    def test_assembly_generates_viewer_html(self, assembled_output, viewer_html):
+        """Assembly generates index.html viewer when splat-transform succeeds."""
+        html = viewer_html.decode("utf-8")
+        project = Project(assembled_output.parent)
+        assert "<title>MyProject — Splatpipe Viewer</title>" in html
+        # PlayCanvas module script, pointed at the LOD metadata splat-transform wrote
+        assert '<script type="module">' in html
+        assert "import * as pc from 'playcanvas';" in html
+        assert "const SPLAT_URL = 'lod-meta.json';" in html
+        # Only lod0 is reviewed in the template, so one switch distance is baked in
+        assert f"const lodDistances = {json.dumps(project.lod_distances[:1])};" in html
+
+    @pytest.mark.parametrize("needle", [
+        # Project name, LOD metadata and engine
+        b"MyProject", b"lod-meta.json", b"playcanvas", b"unified: true",
+        # Custom preset button and slider panel
+        b'data-preset="custom"', b'id="lod-sliders"',
+        # viewer-config.json loading
+        b"viewer-config.json", b"pitchRange",
+        # Annotation markers
+        b"annotation-markers", b"ann-marker", b"ann-dot",
+        # Post-processing and background
+        b"TONEMAP", b"pp.exposure", b"pp.tonemapping", b"bg.color", b"fromString",
+        # Audio component systems and source loading
+        b"SoundComponentSystem", b"AudioListenerComponentSystem", b"AudioHandler",
+        b"audiolistener", b"viewerConfig.audio",
+    ])
+    def test_assembly_viewer_html_contains(self, viewer_html, needle):
+        """Production viewer index.html carries every feature hook."""
+        assert needle in viewer_html
+
+    @pytest.mark.parametrize("sh_bands,expected", [(None, "3"), (2, "2")])
+    def test_assembly_filter_harmonics(self, assembly_project, mock_run, sh_bands, expected):
+        """Assembly passes --filter-harmonics from step_settings, defaulting to 3."""
+        project = assembly_project
+        if sh_bands is not None:
+            project.set_step_settings("assemble", {"sh_bands": sh_bands})
+
+        _run_assembly(project)
 
         call_cmd = mock_run.call_args[0][0]
         idx = call_cmd.index("--filter-harmonics")
-        assert call_cmd[idx + 1] == "3"
-
-    def test_assembly_no_viewer_on_failure(self, tmp_path):
-        """Assembly does NOT generate viewer when splat-transform fails."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error"
+        assert call_cmd[idx + 1] == expected
 
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
+    def test_assembly_no_viewer_on_failure(self, assembly_project, mock_run):
+        """Assembly writes neither index.html nor viewer-config.json when splat-transform fails."""
+        mock_run.return_value = _completed(returncode=1)
+        _run_assembly(assembly_project)
 
-        assert not (output_dir / "index.html").exists()
+        written = set(os.listdir(assembly_project.get_folder(FOLDER_OUTPUT)))
+        assert not written & {"index.html", "viewer-config.json"}
 
-    def test_assembly_writes_viewer_config(self, tmp_path):
+    def test_assembly_writes_viewer_config(self, assembled_output):
         """Assembly writes viewer-config.json on success."""
         import json as _json
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "MyProject")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        config_path = output_dir / "viewer-config.json"
-        assert config_path.exists()
-        cfg = _json.loads(config_path.read_text())
+        cfg = _json.loads((assembled_output / "viewer-config.json").read_bytes())
         assert "camera" in cfg
         assert cfg["camera"]["pitch_min"] == -89
 
-    def test_assembly_viewer_config_uses_project_scene_config(self, tmp_path):
+    def test_assembly_viewer_config_uses_project_scene_config(self, assembly_project):
         """viewer-config.json contains project's scene_config values."""
         import json as _json
-        from splatpipe.core.project import Project
 
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
+        project = assembly_project
         project.set_scene_config_section("camera", {"ground_height": 5.0})
 
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
+        _run_assembly(project)
 
-        cfg = _json.loads((output_dir / "viewer-config.json").read_text())
+        cfg = _json.loads((project.get_folder(FOLDER_OUTPUT) / "viewer-config.json").read_text())
         assert cfg["camera"]["ground_height"] == 5.0
 
-    def test_assembly_no_viewer_config_on_failure(self, tmp_path):
-        """Assembly does NOT write viewer-config.json when splat-transform fails."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error"
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        assert not (output_dir / "viewer-config.json").exists()
-
-    def test_assembly_copies_assets_folder(self, tmp_path):
+    def test_assembly_copies_assets_folder(self, assembly_project, _assets_template):
         """Assembly copies project assets/ to output."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        (project.root / "assets" / "audio").mkdir(parents=True)
-        (project.root / "assets" / "audio" / "test.mp3").write_bytes(b"fake")
-
-        step = LodAssemblyStep(project, config)
+        project = assembly_project
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
+        if os.name == "nt":  # symlinks need elevated rights on Windows
+            shutil.copytree(_assets_template, project.root / "assets")
+        else:
+            (project.root / "assets").symlink_to(_assets_template, target_is_directory=True)
 
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
+        _run_assembly(project)
 
-        assert (output_dir / "assets" / "audio" / "test.mp3").exists()
+        assert (project.get_folder(FOLDER_OUTPUT) / "assets" / "audio" / "test.mp3").exists()
 
-    def test_assembly_no_error_without_assets_folder(self, tmp_path):
+    def test_assembly_no_error_without_assets_folder(self, assembled_output):
         """Assembly succeeds when no assets/ folder exists."""
-        from splatpipe.core.project import Project
+        assert not (assembled_output / "assets").exists()
 
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        assert not (output_dir / "assets").exists()
-
-    def test_assembly_viewer_config_includes_splat_budget(self, tmp_path):
+    def test_assembly_viewer_config_includes_splat_budget(self, assembly_project):
         """viewer-config.json contains splat_budget from project scene_config."""
         import json as _json
-        from splatpipe.core.project import Project
 
-        project = Project.create(tmp_path / "proj", "Test")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
+        project = assembly_project
         project.set_scene_config_section("splat_budget", 3000000)
 
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
+        _run_assembly(project)
 
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        cfg = _json.loads((output_dir / "viewer-config.json").read_text())
+        cfg = _json.loads((project.get_folder(FOLDER_OUTPUT) / "viewer-config.json").read_text())
         assert cfg["splat_budget"] == 3000000
 
-    def test_assembly_viewer_html_has_custom_preset(self, tmp_path):
-        """Production viewer index.html contains Custom preset button and slider panel."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "MyProject")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        html = (output_dir / "index.html").read_text(encoding="utf-8")
-        assert 'data-preset="custom"' in html
-        assert 'id="lod-sliders"' in html
-
-    def test_assembly_viewer_html_has_config_loading(self, tmp_path):
-        """Production viewer index.html fetches viewer-config.json."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "MyProject")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        html = (output_dir / "index.html").read_text(encoding="utf-8")
-        assert "viewer-config.json" in html
-        assert "pitchRange" in html
-
-    def test_assembly_viewer_html_has_annotation_markers(self, tmp_path):
-        """Production viewer index.html has annotation marker support."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "MyProject")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        html = (output_dir / "index.html").read_text(encoding="utf-8")
-        assert "annotation-markers" in html
-        assert "ann-marker" in html
-        assert "ann-dot" in html
-
-    def test_assembly_viewer_html_has_postprocessing(self, tmp_path):
-        """Production viewer index.html has post-processing and background support."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "MyProject")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        html = (output_dir / "index.html").read_text(encoding="utf-8")
-        assert "TONEMAP" in html
-        assert "pp.exposure" in html
-        assert "pp.tonemapping" in html
-        assert "bg.color" in html
-        assert "fromString" in html
-
-    def test_assembly_viewer_html_has_audio_support(self, tmp_path):
-        """Production viewer index.html has audio component systems and source loading."""
-        from splatpipe.core.project import Project
-
-        project = Project.create(tmp_path / "proj", "MyProject")
-        config = {"tools": {"splat_transform": "@playcanvas/splat-transform"}}
-
-        review_dir = project.get_folder("04_review")
-        review_dir.mkdir(parents=True, exist_ok=True)
-        _create_fake_ply(review_dir / "lod0_reviewed.ply")
-
-        step = LodAssemblyStep(project, config)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Done"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            output_dir = project.get_folder("05_output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            step.run(output_dir)
-
-        html = (output_dir / "index.html").read_text(encoding="utf-8")
-        assert "SoundComponentSystem" in html
-        assert "AudioListenerComponentSystem" in html
-        assert "AudioHandler" in html
-        assert "audiolistener" in html
-        assert "viewerConfig.audio" in html
-
 
 # splat-transform v2.0.4 stderr captured from a real run on a 46K-gaussian PLY
 # (`npx --yes @playcanvas/splat-transform@2.0.4 --no-tty input.ply -l 0
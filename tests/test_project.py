@@ -1,25 +1,27 @@
 """Tests for Project class: folder scaffolding, state CRUD."""
 
-import json
+import os
 
 import pytest
 
-from splatpipe.core.constants import PROJECT_FOLDERS
+from splatpipe.core.constants import DEFAULT_LOD_LEVELS, PROJECT_FOLDERS
 from splatpipe.core.project import Project
+from tests.conftest import load_state
 
 
 def test_create_project(tmp_path):
     """Verify all folders are created and state.json is written."""
     project = Project.create(tmp_path / "proj", "TestProject")
 
-    for folder in PROJECT_FOLDERS:
-        assert (project.root / folder).is_dir()
+    with os.scandir(project.root) as it:
+        present = {entry.name for entry in it if entry.is_dir()}
+    assert set(PROJECT_FOLDERS) <= present
 
     assert project.state_path.exists()
-    state = json.loads(project.state_path.read_text())
+    state = project.state
     assert state["name"] == "TestProject"
     assert state["trainer"] == "postshot"
-    assert len(state["lod_levels"]) == 6
+    assert len(state["lod_levels"]) == len(DEFAULT_LOD_LEVELS)
     assert state["steps"] == {}
 
 
@@ -49,18 +51,18 @@ def test_create_project_colmap_source(tmp_path):
     assert project.state["colmap_source"] == r"H:\some\colmap\dir"
 
 
-def test_record_step(tmp_path):
+def test_record_step(fresh_project):
     """Recording a step updates state.json."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.record_step("clean", "completed", summary={"cameras_kept": 42})
 
     assert project.get_step_status("clean") == "completed"
     assert project.get_step_summary("clean") == {"cameras_kept": 42}
 
 
-def test_record_step_failed(tmp_path):
+def test_record_step_failed(fresh_project):
     """Failed step records error."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.record_step("train", "failed", error="CUDA out of memory")
 
     assert project.get_step_status("train") == "failed"
@@ -68,16 +70,16 @@ def test_record_step_failed(tmp_path):
     assert step["error"] == "CUDA out of memory"
 
 
-def test_step_not_run(tmp_path):
+def test_step_not_run(fresh_project):
     """Unrun step returns None."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     assert project.get_step_status("clean") is None
     assert project.get_step_summary("clean") is None
 
 
-def test_state_json_roundtrip(tmp_path):
+def test_state_json_roundtrip(fresh_project):
     """Write + read state.json preserves all fields."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.record_step("clean", "completed", summary={"test": 42})
 
     # Reload from disk
@@ -87,9 +89,9 @@ def test_state_json_roundtrip(tmp_path):
     assert project2.get_step_summary("clean") == {"test": 42}
 
 
-def test_find_project(tmp_path):
+def test_find_project(fresh_project):
     """Find project by walking up from subdirectory."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     subdir = project.root / "02_colmap_clean" / "nested"
     subdir.mkdir(parents=True)
 
@@ -104,37 +106,35 @@ def test_find_project_not_found(tmp_path):
         Project.find(tmp_path)
 
 
-def test_get_folder(tmp_path):
+def test_get_folder(fresh_project):
     """get_folder returns correct path."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     clean_dir = project.get_folder("02_colmap_clean")
     assert clean_dir == project.root / "02_colmap_clean"
     assert clean_dir.is_dir()
 
 
-def test_reset_step(tmp_path):
+def test_reset_step(fresh_project):
     """reset_step removes step entry, making status None (pending)."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.record_step("clean", "completed", summary={"cameras_kept": 42})
     assert project.get_step_status("clean") == "completed"
 
     project.reset_step("clean")
     assert project.get_step_status("clean") is None
-    # Verify persisted
-    project2 = Project(project.root)
-    assert project2.get_step_status("clean") is None
+    assert "clean" not in load_state(project.root)["steps"]
 
 
-def test_reset_step_nonexistent(tmp_path):
+def test_reset_step_nonexistent(fresh_project):
     """reset_step on a step that hasn't run is a no-op."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.reset_step("clean")  # should not raise
     assert project.get_step_status("clean") is None
 
 
-def test_reset_all_steps(tmp_path):
+def test_reset_all_steps(fresh_project):
     """reset_all_steps clears all step entries."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.record_step("clean", "completed")
     project.record_step("train", "failed", error="test")
     project.record_step("assemble", "completed")
@@ -143,41 +143,35 @@ def test_reset_all_steps(tmp_path):
     assert project.get_step_status("clean") is None
     assert project.get_step_status("train") is None
     assert project.get_step_status("assemble") is None
-    # Verify persisted
-    project2 = Project(project.root)
-    assert project2.state["steps"] == {}
+    assert load_state(project.root)["steps"] == {}
 
 
-def test_export_mode_default(tmp_path):
+def test_export_mode_default(fresh_project):
     """Export mode defaults to 'folder'."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     assert project.export_mode == "folder"
 
 
-def test_set_export_mode(tmp_path):
+def test_set_export_mode(fresh_project):
     """set_export_mode persists to state.json."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.set_export_mode("cdn")
     assert project.export_mode == "cdn"
-    # Verify persisted
-    project2 = Project(project.root)
-    assert project2.export_mode == "cdn"
+    assert load_state(project.root)["export_mode"] == "cdn"
 
 
-def test_export_folder_default(tmp_path):
+def test_export_folder_default(fresh_project):
     """Export folder defaults to empty string."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     assert project.export_folder == ""
 
 
-def test_set_export_folder(tmp_path):
+def test_set_export_folder(fresh_project):
     """set_export_folder persists to state.json."""
-    project = Project.create(tmp_path / "proj", "Test")
+    project = fresh_project
     project.set_export_folder(r"Z:\output\test")
     assert project.export_folder == r"Z:\output\test"
-    # Verify persisted
-    project2 = Project(project.root)
-    assert project2.export_folder == r"Z:\output\test"
+    assert load_state(project.root)["export_folder"] == r"Z:\output\test"
 
 
 # ── Passthrough trainer + .ply source coverage ────────────────────────
@@ -299,7 +293,7 @@ def test_save_state_is_atomic(tmp_path, monkeypatch):
     assert src.endswith(".tmp")
     assert dst == str(project.state_path)
     # Final file is still valid JSON with the new name
-    assert Project(project.root).name == "Renamed"
+    assert load_state(project.root)["name"] == "Renamed"
 
 
 def test_source_type_falls_back_to_ply_extension(tmp_path):
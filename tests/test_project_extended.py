@@ -1,72 +1,48 @@
 """Extended tests for Project class: setters, colmap_dir fallback, step_settings, LODs."""
 
-
+import pytest
 
 from splatpipe.core.project import Project
+from tests.conftest import load_state
+
+# Steps a new (non-passthrough) project starts with enabled
+_DEFAULT_ON_STEPS = ("train", "assemble", "export")
 
 
 class TestSetters:
     """Verify each setter persists to disk."""
 
-    def test_set_name(self, tmp_path):
-        proj = Project.create(tmp_path / "p", "Original")
-        proj.set_name("Renamed")
-        assert proj.name == "Renamed"
-        reloaded = Project(proj.root)
-        assert reloaded.name == "Renamed"
-
-    def test_set_trainer(self, tmp_path):
-        proj = Project.create(tmp_path / "p", "T")
-        proj.set_trainer("lichtfeld")
-        assert proj.trainer == "lichtfeld"
-        reloaded = Project(proj.root)
-        assert reloaded.trainer == "lichtfeld"
-
-    def test_set_lod_levels(self, tmp_path):
-        proj = Project.create(tmp_path / "p", "T")
-        new_lods = [{"name": "lod0_5000k", "max_splats": 5_000_000}]
-        proj.set_lod_levels(new_lods)
-        assert len(proj.lod_levels) == 1
-        assert proj.lod_levels[0]["max_splats"] == 5_000_000
-        reloaded = Project(proj.root)
-        assert len(reloaded.lod_levels) == 1
-
-    def test_set_alignment_file(self, tmp_path):
-        proj = Project.create(tmp_path / "p", "T")
-        proj.set_alignment_file(r"H:\align.txt")
-        assert proj.alignment_file == r"H:\align.txt"
-        reloaded = Project(proj.root)
-        assert reloaded.alignment_file == r"H:\align.txt"
-
-    def test_set_colmap_source(self, tmp_path):
-        proj = Project.create(tmp_path / "p", "T")
-        proj.set_colmap_source(r"H:\colmap_data")
-        assert proj.colmap_source == r"H:\colmap_data"
-        reloaded = Project(proj.root)
-        assert reloaded.colmap_source == r"H:\colmap_data"
+    @pytest.mark.parametrize("setter,key,value", [
+        ("set_name", "name", "Renamed"),
+        ("set_trainer", "trainer", "lichtfeld"),
+        ("set_lod_levels", "lod_levels", [{"name": "lod0_5000k", "max_splats": 5_000_000}]),
+        ("set_alignment_file", "alignment_file", r"H:\align.txt"),
+        ("set_colmap_source", "colmap_source", r"H:\colmap_data"),
+        ("set_has_thumbnail", "has_thumbnail", True),
+    ], ids=["name", "trainer", "lod_levels", "alignment_file", "colmap_source", "has_thumbnail"])
+    def test_setter_persists(self, fresh_project, setter, key, value):
+        proj = fresh_project
+        getattr(proj, setter)(value)
+        assert getattr(proj, key) == value
+        assert load_state(proj.root)[key] == value
 
-    def test_set_has_thumbnail(self, tmp_path):
-        proj = Project.create(tmp_path / "p", "T")
-        assert proj.has_thumbnail is False
-        proj.set_has_thumbnail(True)
-        assert proj.has_thumbnail is True
-        reloaded = Project(proj.root)
-        assert reloaded.has_thumbnail is True
+    def test_has_thumbnail_default(self, project_template):
+        assert project_template.has_thumbnail is False
 
 
 class TestColmapDir:
     """colmap_dir() fallback chain tests."""
 
-    def test_bare_directory(self, tmp_path):
+    def test_bare_directory(self, fresh_project):
         """When 01_colmap_source is a plain directory, returns it."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         source = proj.get_folder("01_colmap_source")
         assert source.is_dir()
         assert proj.colmap_dir() == source
 
-    def test_fallback_to_state_colmap_source(self, tmp_path):
+    def test_fallback_to_state_colmap_source(self, tmp_path, fresh_project):
         """When 01_colmap_source doesn't exist, falls back to state.json colmap_source."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         # Remove the 01_colmap_source directory
         source = proj.get_folder("01_colmap_source")
         source.rmdir()
@@ -80,9 +56,9 @@ class TestColmapDir:
         result = proj.colmap_dir()
         assert result == real_dir
 
-    def test_fallback_returns_default_when_nothing_exists(self, tmp_path):
+    def test_fallback_returns_default_when_nothing_exists(self, fresh_project):
         """When 01_colmap_source gone and colmap_source path doesn't exist, returns default."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         source = proj.get_folder("01_colmap_source")
         source.rmdir()
         # colmap_source points to nonexistent dir
@@ -91,9 +67,9 @@ class TestColmapDir:
         # Returns the default path (01_colmap_source) even though it doesn't exist
         assert result == proj.root / "01_colmap_source"
 
-    def test_fallback_empty_colmap_source(self, tmp_path):
+    def test_fallback_empty_colmap_source(self, fresh_project):
         """When colmap_source is empty string, falls back to default."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         source = proj.get_folder("01_colmap_source")
         source.rmdir()
         # Default colmap_source is None from create (gets "")
@@ -102,22 +78,21 @@ class TestColmapDir:
 
 
 class TestStepSettings:
-    def test_default_empty(self, tmp_path):
+    def test_default_empty(self, project_template):
         """step_settings defaults to empty dict."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         assert proj.step_settings == {}
 
-    def test_set_step_settings(self, tmp_path):
+    def test_set_step_settings(self, fresh_project):
         """set_step_settings persists correctly."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_step_settings("clean", {"kdtree_threshold": 0.005})
         assert proj.step_settings["clean"]["kdtree_threshold"] == 0.005
-        reloaded = Project(proj.root)
-        assert reloaded.step_settings["clean"]["kdtree_threshold"] == 0.005
+        assert load_state(proj.root)["step_settings"]["clean"]["kdtree_threshold"] == 0.005
 
-    def test_set_multiple_steps(self, tmp_path):
+    def test_set_multiple_steps(self, fresh_project):
         """Setting one step preserves others."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_step_settings("clean", {"threshold": 0.1})
         proj.set_step_settings("train", {"profile": "Splat MCMC"})
         assert proj.step_settings["clean"]["threshold"] == 0.1
@@ -125,46 +100,41 @@ class TestStepSettings:
 
 
 class TestEnabledLods:
-    def test_all_enabled_by_default(self, tmp_path):
+    def test_all_enabled_by_default(self, project_template):
         """All LODs are enabled by default (no 'enabled' key)."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         enabled = proj.get_enabled_lods()
         assert len(enabled) == len(proj.lod_levels)
 
-    def test_some_disabled(self, tmp_path):
-        """Disabled LODs are filtered out."""
-        proj = Project.create(tmp_path / "p", "T")
-        proj.set_lod_enabled(0, False)
-        proj.set_lod_enabled(2, False)
-        enabled = proj.get_enabled_lods()
-        total = len(proj.lod_levels)
-        assert len(enabled) == total - 2
-
-    def test_set_lod_enabled_persistence(self, tmp_path):
-        """set_lod_enabled persists to disk."""
-        proj = Project.create(tmp_path / "p", "T")
-        proj.set_lod_enabled(1, False)
-        reloaded = Project(proj.root)
-        assert reloaded.lod_levels[1]["enabled"] is False
-
-    def test_set_lod_enabled_invalid_index(self, tmp_path):
+    @pytest.mark.parametrize("disabled", [(1,), (0, 2)])
+    def test_set_lod_enabled_roundtrip(self, fresh_project, disabled):
+        """Disabled LODs are filtered out and the flags persist to disk."""
+        proj = fresh_project
+        for index in disabled:
+            proj.set_lod_enabled(index, False)
+        assert len(proj.get_enabled_lods()) == len(proj.lod_levels) - len(disabled)
+        saved = load_state(proj.root)["lod_levels"]
+        for index in disabled:
+            assert saved[index]["enabled"] is False
+
+    def test_set_lod_enabled_invalid_index(self, fresh_project):
         """Invalid index is a no-op (no crash)."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_lod_enabled(999, False)  # should not raise
         proj.set_lod_enabled(-1, False)  # should not raise
 
 
 class TestLodDistances:
-    def test_default_distances(self, tmp_path):
+    def test_default_distances(self, project_template):
         """Default distances match PlayCanvas defaults, length matches LOD count."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         distances = proj.lod_distances
         assert len(distances) == len(proj.lod_levels)
         assert distances[0] == 5  # First PlayCanvas default
 
-    def test_set_lod_distances(self, tmp_path):
+    def test_set_lod_distances(self, fresh_project):
         """Custom distances persist."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         custom = [10, 20, 30, 40, 50, 60]
         proj.set_lod_distances(custom)
         assert proj.lod_distances == custom
@@ -173,48 +143,47 @@ class TestLodDistances:
 
 
 class TestEnabledSteps:
-    def test_default_enabled_steps(self, tmp_path):
-        """Clean disabled by default, others enabled."""
-        proj = Project.create(tmp_path / "p", "T")
-        assert proj.is_step_enabled("clean") is False
-        for step in ["train", "assemble", "export"]:
-            assert proj.is_step_enabled(step) is True
-
-    def test_set_step_enabled(self, tmp_path):
-        """Disable a step and verify."""
-        proj = Project.create(tmp_path / "p", "T")
-        proj.set_step_enabled("assemble", False)
-        assert proj.is_step_enabled("assemble") is False
-        assert proj.is_step_enabled("train") is True  # others unchanged
-
-    def test_step_enabled_persistence(self, tmp_path):
-        """set_step_enabled persists."""
-        proj = Project.create(tmp_path / "p", "T")
-        proj.set_step_enabled("train", False)
-        reloaded = Project(proj.root)
-        assert reloaded.is_step_enabled("train") is False
-
-    def test_unknown_step_defaults_true(self, tmp_path):
+    def test_clean_disabled_by_default(self, project_template):
+        """Clean is disabled by default."""
+        assert project_template.is_step_enabled("clean") is False
+
+    @pytest.mark.parametrize("step", _DEFAULT_ON_STEPS)
+    def test_step_enabled_by_default(self, project_template, step):
+        """Every other step starts enabled."""
+        assert project_template.is_step_enabled(step) is True
+
+    @pytest.mark.parametrize("step,enabled", [
+        ("assemble", False), ("train", False), ("clean", True),
+    ])
+    def test_set_step_enabled_roundtrip(self, fresh_project, step, enabled):
+        """set_step_enabled flips only that step and persists."""
+        proj = fresh_project
+        proj.set_step_enabled(step, enabled)
+        assert proj.is_step_enabled(step) is enabled
+        assert proj.is_step_enabled("export") is True  # others unchanged
+        assert Project(proj.root).is_step_enabled(step) is enabled
+
+    def test_unknown_step_defaults_true(self, project_template):
         """Unknown step defaults to enabled."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         assert proj.is_step_enabled("nonexistent") is True
 
 
 class TestCdnName:
-    def test_cdn_name_defaults_to_project_name(self, tmp_path):
+    def test_cdn_name_defaults_to_project_name(self, project_template):
         """cdn_name defaults to project name when not set."""
-        proj = Project.create(tmp_path / "p", "MyProject")
-        assert proj.cdn_name == "MyProject"
+        proj = project_template  # named "Test"
+        assert proj.cdn_name == "Test"
 
-    def test_cdn_name_empty_defaults_to_project_name(self, tmp_path):
+    def test_cdn_name_empty_defaults_to_project_name(self, fresh_project):
         """cdn_name empty string still defaults to project name."""
-        proj = Project.create(tmp_path / "p", "MyProject")
+        proj = fresh_project
         proj.set_cdn_name("")
-        assert proj.cdn_name == "MyProject"
+        assert proj.cdn_name == "Test"
 
-    def test_cdn_name_set_and_persist(self, tmp_path):
+    def test_cdn_name_set_and_persist(self, fresh_project):
         """set_cdn_name persists and overrides default."""
-        proj = Project.create(tmp_path / "p", "MyProject")
+        proj = fresh_project
         proj.set_cdn_name("custom_folder")
         assert proj.cdn_name == "custom_folder"
         reloaded = Project(proj.root)
@@ -222,16 +191,16 @@ class TestCdnName:
 
 
 class TestThumbnailPath:
-    def test_thumbnail_path(self, tmp_path):
+    def test_thumbnail_path(self, project_template):
         """thumbnail_path points to root/thumbnail.jpg."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         assert proj.thumbnail_path == proj.root / "thumbnail.jpg"
 
 
 class TestHistory:
-    def test_record_step_appends_history(self, tmp_path):
+    def test_record_step_appends_history(self, fresh_project):
         """record_step with terminal status appends to history."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.record_step("clean", "completed", summary={"cameras_kept": 42})
         history = proj.get_history()
         assert len(history) == 1
@@ -239,48 +208,54 @@ class TestHistory:
         assert history[0]["status"] == "completed"
         assert history[0]["summary"]["cameras_kept"] == 42
 
-    def test_running_status_not_in_history(self, tmp_path):
+    def test_running_status_not_in_history(self, fresh_project):
         """Intermediate statuses like 'running' are NOT appended to history."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.record_step("clean", "running")
         assert proj.get_history() == []
 
-    def test_waiting_status_not_in_history(self, tmp_path):
+    def test_waiting_status_not_in_history(self, fresh_project):
         """'waiting' status is NOT appended to history."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.record_step("review", "waiting")
         assert proj.get_history() == []
 
-    def test_history_newest_first(self, tmp_path):
+    def test_history_newest_first(self, fresh_project):
         """get_history() returns newest first."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.record_step("clean", "completed")
         proj.record_step("train", "completed")
         history = proj.get_history()
         assert history[0]["step"] == "train"
         assert history[1]["step"] == "clean"
 
-    def test_history_backward_compat(self, tmp_path):
+    def test_history_backward_compat(self, fresh_project):
         """Old projects without 'history' key return empty list."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         # Simulate old state.json without history key
         proj.state.pop("history", None)
         proj._save_state()
         reloaded = Project(proj.root)
         assert reloaded.get_history() == []
 
-    def test_history_limit(self, tmp_path):
+    def test_history_limit(self, fresh_project):
         """History is capped at _HISTORY_MAX entries."""
-        proj = Project.create(tmp_path / "p", "T")
-        for i in range(120):
-            proj.record_step("clean", "completed", summary={"run": i})
-        assert len(proj.state.get("history", [])) == 100
-        # Newest kept
+        proj = fresh_project
+        # Seed 119 entries directly; the trim is triggered by the 120th run.
+        proj.state["history"] = [
+            {"step": "clean", "status": "completed", "summary": {"run": i}}
+            for i in range(119)
+        ]
+        proj.record_step("clean", "completed", summary={"run": 119})
+        assert len(proj.state["history"]) == 100
+        assert len(load_state(proj.root)["history"]) == 100
+        # Newest kept, oldest dropped
         assert proj.get_history()[0]["summary"]["run"] == 119
+        assert proj.get_history()[-1]["summary"]["run"] == 20
 
-    def test_history_with_started_at(self, tmp_path):
+    def test_history_with_started_at(self, fresh_project):
         """Passing started_at computes duration."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.record_step(
             "export", "completed",
             summary={"uploaded": 5},
@@ -291,9 +266,9 @@ class TestHistory:
         assert entry["duration_s"] is not None
         assert entry["duration_s"] >= 0
 
-    def test_history_trims_failed_files(self, tmp_path):
+    def test_history_trims_failed_files(self, fresh_project):
         """Large failed_files lists are trimmed in history copies."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         big_summary = {"failed_files": [f"file_{i}" for i in range(50)]}
         proj.record_step("export", "failed", summary=big_summary, error="test")
         entry = proj.get_history()[0]
@@ -302,9 +277,9 @@ class TestHistory:
         step_summary = proj.get_step_summary("export")
         assert len(step_summary["failed_files"]) == 50
 
-    def test_failed_and_cancelled_in_history(self, tmp_path):
+    def test_failed_and_cancelled_in_history(self, fresh_project):
         """Failed and cancelled statuses are logged to history."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.record_step("train", "failed", error="CUDA OOM")
         proj.record_step("export", "cancelled")
         history = proj.get_history()
@@ -314,22 +289,45 @@ class TestHistory:
         assert history[1]["step"] == "train"
         assert history[1]["error"] == "CUDA OOM"
 
+    def test_record_step_batch_single_write(self, fresh_project, monkeypatch):
+        """record_step_batch applies every update and writes state.json once."""
+        proj = fresh_project
+        writes = []
+        real_save = Project._save_state
+        monkeypatch.setattr(Project, "_save_state", lambda self: (writes.append(1), real_save(self)))
+
+        proj.record_step_batch([
+            ("clean", "completed", {"summary": {"cameras_kept": 3}}),
+            ("train", "failed", {"error": "Interrupted"}),
+        ])
+        assert len(writes) == 1
+
+        reloaded = Project(proj.root)
+        assert reloaded.get_step_status("clean") == "completed"
+        assert reloaded.get_step_status("train") == "failed"
+        assert [e["step"] for e in reloaded.get_history()] == ["train", "clean"]
+
+    def test_record_step_batch_empty_is_noop(self, fresh_project, monkeypatch):
+        proj = fresh_project
+        monkeypatch.setattr(Project, "_save_state", lambda self: pytest.fail("unexpected write"))
+        proj.record_step_batch([])
+
 
 class TestSceneConfig:
     """Tests for scene_config property and set_scene_config_section."""
 
-    def test_defaults_when_unset(self, tmp_path):
+    def test_defaults_when_unset(self, project_template):
         """scene_config returns full defaults for new projects."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         cfg = proj.scene_config
         assert cfg["camera"]["pitch_min"] == -89
         assert cfg["camera"]["bounds_radius"] == 150
         assert cfg["annotations"] == []
         assert cfg["audio"] == []
 
-    def test_camera_round_trip(self, tmp_path):
+    def test_camera_round_trip(self, fresh_project):
         """set_scene_config_section persists camera to disk."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("camera", {
             "pitch_min": -45, "pitch_max": 45,
             "zoom_min": 2, "zoom_max": 100,
@@ -339,55 +337,55 @@ class TestSceneConfig:
         assert reloaded.scene_config["camera"]["pitch_min"] == -45
         assert reloaded.scene_config["camera"]["bounds_radius"] == 50
 
-    def test_partial_camera_override(self, tmp_path):
+    def test_partial_camera_override(self, fresh_project):
         """Setting only ground_height preserves other camera defaults."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("camera", {"ground_height": 2.0})
         cfg = proj.scene_config
         assert cfg["camera"]["ground_height"] == 2.0
         assert cfg["camera"]["pitch_min"] == -89
         assert cfg["camera"]["zoom_max"] == 200
 
-    def test_camera_constraints_default_disabled(self, tmp_path):
+    def test_camera_constraints_default_disabled(self, project_template):
         """Camera constraints are off by default — viewer lets the user fly free."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         assert proj.scene_config["camera"]["enabled"] is False
 
-    def test_camera_partial_save_preserves_enabled_flag(self, tmp_path):
+    def test_camera_partial_save_preserves_enabled_flag(self, fresh_project):
         """Saving pitch_min via the numbers form must NOT clobber the enabled toggle.
 
         The constraints toggle and the constraint-value form post separately;
         both go to set_scene_config_section('camera', ...). The merge behavior
         protects the enabled flag from being wiped by a partial number update.
         """
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("camera", {"enabled": True})
         proj.set_scene_config_section("camera", {"pitch_min": -45})
         cfg = Project(proj.root).scene_config
         assert cfg["camera"]["enabled"] is True
         assert cfg["camera"]["pitch_min"] == -45
 
-    def test_annotations_replace_not_merge(self, tmp_path):
+    def test_annotations_replace_not_merge(self, fresh_project):
         """Annotations list replaces default empty list wholesale."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         annotations = [{"pos": [1, 2, 3], "title": "Test", "text": "Desc", "label": "1"}]
         proj.set_scene_config_section("annotations", annotations)
         cfg = proj.scene_config
         assert len(cfg["annotations"]) == 1
         assert cfg["annotations"][0]["title"] == "Test"
 
-    def test_sections_independent(self, tmp_path):
+    def test_sections_independent(self, fresh_project):
         """Setting camera doesn't affect annotations and vice versa."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("camera", {"ground_height": 5.0})
         proj.set_scene_config_section("annotations", [{"pos": [0, 0, 0], "title": "A", "text": "", "label": "1"}])
         cfg = proj.scene_config
         assert cfg["camera"]["ground_height"] == 5.0
         assert len(cfg["annotations"]) == 1
 
-    def test_backward_compat_old_project(self, tmp_path):
+    def test_backward_compat_old_project(self, fresh_project):
         """Old project without scene_config returns all defaults."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         # Simulate old project: ensure no scene_config in state
         proj.state.pop("scene_config", None)
         proj._save_state()
@@ -396,29 +394,29 @@ class TestSceneConfig:
         assert cfg["camera"]["pitch_min"] == -89
         assert cfg["annotations"] == []
 
-    def test_splat_budget_default_zero(self, tmp_path):
+    def test_splat_budget_default_zero(self, project_template):
         """splat_budget defaults to 0 (platform default)."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         assert proj.scene_config["splat_budget"] == 0
 
-    def test_splat_budget_round_trip(self, tmp_path):
+    def test_splat_budget_round_trip(self, fresh_project):
         """set_scene_config_section persists splat_budget as int."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("splat_budget", 3000000)
         reloaded = Project(proj.root)
         assert reloaded.scene_config["splat_budget"] == 3000000
 
-    def test_splat_budget_does_not_affect_camera(self, tmp_path):
+    def test_splat_budget_does_not_affect_camera(self, fresh_project):
         """Setting splat_budget doesn't interfere with camera defaults."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("splat_budget", 2000000)
         cfg = proj.scene_config
         assert cfg["splat_budget"] == 2000000
         assert cfg["camera"]["pitch_min"] == -89
 
-    def test_add_multiple_annotations(self, tmp_path):
+    def test_add_multiple_annotations(self, fresh_project):
         """Multiple annotations stored and retrieved correctly."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("annotations", [
             {"pos": [1, 0, 0], "title": "A", "text": "", "label": "1"},
             {"pos": [0, 1, 0], "title": "B", "text": "", "label": "2"},
@@ -426,9 +424,9 @@ class TestSceneConfig:
         assert len(proj.scene_config["annotations"]) == 2
         assert proj.scene_config["annotations"][1]["title"] == "B"
 
-    def test_annotations_survive_reload(self, tmp_path):
+    def test_annotations_survive_reload(self, fresh_project):
         """Annotations persist across project reload."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("annotations", [
             {"pos": [1, 2, 3], "title": "X", "text": "Y", "label": "1"}
         ])
@@ -436,33 +434,33 @@ class TestSceneConfig:
         assert reloaded.scene_config["annotations"][0]["title"] == "X"
         assert reloaded.scene_config["annotations"][0]["pos"] == [1, 2, 3]
 
-    def test_background_default(self, tmp_path):
+    def test_background_default(self, project_template):
         """Background defaults to color #1a1a1a."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         bg = proj.scene_config["background"]
         assert bg["type"] == "color"
         assert bg["color"] == "#1a1a1a"
 
-    def test_background_round_trip(self, tmp_path):
+    def test_background_round_trip(self, fresh_project):
         """set_scene_config_section persists background color."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("background", {"type": "color", "color": "#ff0000"})
         reloaded = Project(proj.root)
         assert reloaded.scene_config["background"]["color"] == "#ff0000"
         assert reloaded.scene_config["background"]["type"] == "color"
 
-    def test_postprocessing_default(self, tmp_path):
+    def test_postprocessing_default(self, project_template):
         """Post-processing defaults to neutral tonemapping, 1.5 exposure."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         pp = proj.scene_config["postprocessing"]
         assert pp["tonemapping"] == "neutral"
         assert pp["exposure"] == 1.5
         assert pp["bloom"] is False
         assert pp["vignette"] is False
 
-    def test_postprocessing_round_trip(self, tmp_path):
+    def test_postprocessing_round_trip(self, fresh_project):
         """set_scene_config_section persists post-processing settings."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("postprocessing", {
             "bloom": True, "bloom_intensity": 0.05, "exposure": 2.0
         })
@@ -473,9 +471,9 @@ class TestSceneConfig:
         assert pp["exposure"] == 2.0
         assert pp["tonemapping"] == "neutral"  # default preserved
 
-    def test_postprocessing_partial_override(self, tmp_path):
+    def test_postprocessing_partial_override(self, fresh_project):
         """Setting only exposure preserves other postprocessing defaults."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("postprocessing", {"exposure": 3.0})
         pp = proj.scene_config["postprocessing"]
         assert pp["exposure"] == 3.0
@@ -483,14 +481,14 @@ class TestSceneConfig:
         assert pp["bloom"] is False
         assert pp["vignette_intensity"] == 0.5
 
-    def test_audio_default_empty(self, tmp_path):
+    def test_audio_default_empty(self, project_template):
         """Audio defaults to empty list."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = project_template
         assert proj.scene_config["audio"] == []
 
-    def test_audio_round_trip(self, tmp_path):
+    def test_audio_round_trip(self, fresh_project):
         """set_scene_config_section persists audio sources."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("audio", [
             {"file": "assets/audio/test.mp3", "volume": 0.8, "loop": True, "positional": False}
         ])
@@ -499,9 +497,9 @@ class TestSceneConfig:
         assert reloaded.scene_config["audio"][0]["volume"] == 0.8
         assert reloaded.scene_config["audio"][0]["loop"] is True
 
-    def test_audio_does_not_affect_other_sections(self, tmp_path):
+    def test_audio_does_not_affect_other_sections(self, fresh_project):
         """Setting audio doesn't interfere with camera or annotations."""
-        proj = Project.create(tmp_path / "p", "T")
+        proj = fresh_project
         proj.set_scene_config_section("audio", [
             {"file": "assets/audio/a.mp3", "volume": 0.5, "loop": True, "positional": False}
         ])
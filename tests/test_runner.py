@@ -26,6 +26,7 @@ from splatpipe.web.runner import (
     cancel_current,
     find_queue_entry,
     queue_position,
+    _peek_review_status,
     _runners,
     _runners_lock,
 )
@@ -58,6 +59,7 @@ def clean_runners():
     """Clear the global runners dict and queue state before each test."""
     with _runners_lock:
         _runners.clear()
+    runner_module._negative_cache.clear()
     runner_module._queue.clear()
     runner_module._queue_current = None
     runner_module._queue_paused = False
@@ -68,6 +70,7 @@ def clean_runners():
         for r in _runners.values():
             r.cancel()
         _runners.clear()
+    runner_module._negative_cache.clear()
     runner_module._queue.clear()
     runner_module._queue_current = None
     runner_module._queue_paused = False
@@ -220,6 +223,49 @@ class TestPipelineRunnerTrain:
         assert (review_dir / "lod0_reviewed.ply").exists()
         assert (review_dir / "lod1_reviewed.ply").exists()
 
+    def test_runner_clears_stale_review_files(self, runner_project):
+        """Old files and dangling symlinks in 04_review are removed; subfolders are kept."""
+        config = _make_config()
+        review_dir = runner_project.get_folder("04_review")
+        (review_dir / "lod5_reviewed.ply").write_text("stale")
+        (review_dir / "keep").mkdir()
+        dangling = review_dir / "lod6_reviewed.ply"
+        try:
+            dangling.symlink_to(review_dir / "gone.ply")
+        except OSError:  # symlinks need elevation on Windows; still check plain files
+            dangling = None
+
+        runner = PipelineRunner(str(runner_project.root), ["train"], config)
+
+        with patch("splatpipe.web.runner.get_trainer") as mock_get:
+            mock_trainer = MagicMock()
+            mock_trainer.train_lod.side_effect = self._mock_train_lod
+            mock_get.return_value = mock_trainer
+
+            runner.start()
+            runner._thread.join(timeout=10)
+
+        assert runner.snapshot.status == "completed"
+        assert not (review_dir / "lod5_reviewed.ply").exists()
+        if dangling is not None:
+            assert not dangling.is_symlink()
+        assert (review_dir / "keep").is_dir()
+
+    def test_runner_failure_recorded_once(self, runner_project):
+        """A failing step writes exactly one failed history entry."""
+        runner_project.set_lod_levels([
+            {"name": "lod0", "max_splats": 1000, "enabled": False},
+        ])
+        runner = PipelineRunner(str(runner_project.root), ["train"], _make_config())
+        with patch("splatpipe.web.runner.get_trainer"):
+            runner.start()
+            runner._thread.join(timeout=10)
+
+        assert runner.snapshot.status == "failed"
+        history = Project(runner_project.root).get_history()
+        assert [(e["step"], e["status"]) for e in history] == [("train", "failed")]
+        assert history[0]["error"] == "No LOD levels enabled"
+
     def test_runner_passes_ppisp_option(self, runner_project):
         """Runner forwards saved PPISP training settings to the active trainer."""
         config = _make_config()
@@ -399,6 +445,48 @@ class TestModuleLevelAPI:
     def test_get_runner_none_when_empty(self):
         assert get_runner("nonexistent/path") is None
 
+    def test_get_runner_negative_cache_evicted_by_start_run(self, runner_project):
+        """A cached miss must not hide a runner started afterwards."""
+        key = str(runner_project.root)
+        assert get_runner(key) is None
+        assert key in runner_module._negative_cache
+
+        with patch("splatpipe.web.runner.ColmapCleanStep") as mock_cls:
+            mock_cls.return_value.execute.return_value = {"summary": {}}
+            runner = start_run(key, ["clean"], _make_config())
+            assert get_runner(key) is runner
+            runner._thread.join(timeout=5)
+
+    def test_get_runner_drops_expired_negative_entry(self):
+        """An expired miss is evicted on lookup and does not hide a runner."""
+        key = str(Path("expired/path"))
+        runner = MagicMock()
+        runner_module._negative_cache[key] = time.monotonic() - 1
+        with _runners_lock:
+            _runners[key] = runner
+        assert get_runner(key) is runner
+        assert key not in runner_module._negative_cache
+
+    def test_get_runner_negative_cache_is_bounded(self, monkeypatch):
+        """The negative cache never grows past _NEG_MAX; the oldest misses go first."""
+        monkeypatch.setattr(runner_module, "_NEG_MAX", 3)
+        for i in range(10):
+            assert get_runner(f"missing/{i}") is None
+            assert len(runner_module._negative_cache) <= 3
+        assert list(runner_module._negative_cache) == [
+            str(Path(f"missing/{i}")) for i in (7, 8, 9)
+        ]
+
+    def test_get_runner_negative_cache_evicts_expired_first(self, monkeypatch):
+        """At the cap, expired entries are evicted before any live one."""
+        monkeypatch.setattr(runner_module, "_NEG_MAX", 3)
+        cache = runner_module._negative_cache
+        cache[str(Path("live/0"))] = time.monotonic() + 60
+        cache[str(Path("stale/0"))] = time.monotonic() - 1
+        cache[str(Path("live/1"))] = time.monotonic() + 60
+        assert get_runner("missing/new") is None
+        assert set(cache) == {str(Path(p)) for p in ("live/0", "live/1", "missing/new")}
+
     def test_start_run_creates_runner(self, runner_project):
         config = _make_config()
         with patch("splatpipe.web.runner.ColmapCleanStep") as mock_cls:
@@ -524,6 +612,45 @@ class TestPipelineRunnerReview:
         assert snap.status == "completed"
         assert snap.progress == 1.0
 
+    def test_peek_review_status(self, runner_project):
+        """Fast-path peek reads steps.review.status without a full reload."""
+        assert _peek_review_status(runner_project.state_path) is None
+        runner_project.record_step("review", "waiting")
+        assert _peek_review_status(runner_project.state_path) == "waiting"
+        runner_project.record_step("review", "completed", summary={"lod_count": 1})
+        assert _peek_review_status(runner_project.state_path) == "completed"
+        assert _peek_review_status(runner_project.root / "missing.json") is None
+
+    def test_peek_review_status_ignores_decoy_review_keys(self, runner_project):
+        """Only steps.review.status counts, not "review" keys elsewhere in state.json."""
+        runner_project.record_step(
+            "clean", "completed", summary={"review": {"status": "completed"}},
+        )
+        runner_project.record_step("review", "waiting")
+        # Decoy ahead of "steps": a step_settings entry named "review"
+        runner_project._state = {
+            "step_settings": {"review": {"status": "completed"}},
+            **runner_project.state,
+        }
+        runner_project._save_state()
+        assert _peek_review_status(runner_project.state_path) == "waiting"
+
+        runner_project.reset_step("review")
+        assert _peek_review_status(runner_project.state_path) is None
+
+    def test_review_approval_survives_later_steps(self, runner_project):
+        """The approval written by another process isn't clobbered by the next step."""
+        runner = PipelineRunner(str(runner_project.root), ["review", "export"], _make_config())
+        runner.start()
+        time.sleep(0.5)
+
+        Project(runner_project.root).record_step("review", "completed", summary={"lod_count": 1})
+        runner._thread.join(timeout=10)
+
+        reloaded = Project(runner_project.root)
+        assert reloaded.get_step_status("review") == "completed"
+        assert reloaded.get_step_summary("review") == {"lod_count": 1}
+
     def test_review_cancellable_while_waiting(self, runner_project):
         """Cancelling while waiting for review stops the runner."""
         config = _make_config()
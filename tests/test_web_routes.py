@@ -51,8 +51,7 @@ def web_env(tmp_path, monkeypatch):
         "lichtfeld": {"strategy": "mcmc", "iterations": 30000},
         "paths": {"projects_root": str(projects_root)},
     }
-    with open(toml_path, "wb") as f:
-        tomli_w.dump(config, f)
+    toml_path.write_bytes(tomli_w.dumps(config).encode("utf-8"))
 
     monkeypatch.setattr("splatpipe.core.config.DEFAULTS_PATH", toml_path)
 
@@ -108,8 +107,7 @@ class TestIndex:
     def test_index_no_projects_root(self, tmp_path, monkeypatch):
         """Root URL redirects to settings when projects_root not set."""
         toml_path = tmp_path / "defaults.toml"
-        with open(toml_path, "wb") as f:
-            tomli_w.dump({"tools": {}, "paths": {"projects_root": ""}}, f)
+        toml_path.write_bytes(tomli_w.dumps({"tools": {}, "paths": {"projects_root": ""}}).encode("utf-8"))
         monkeypatch.setattr("splatpipe.core.config.DEFAULTS_PATH", toml_path)
 
         from splatpipe.web.app import app